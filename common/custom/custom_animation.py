@@ -1,5 +1,6 @@
 from manim import *
 from typing import Callable, Iterable, Optional, Tuple, Type, Union
+from common.utils.curve_utils import get_arc_length_table
 
 class FillAndFade(Transform):
     def __init__(
@@ -45,4 +46,26 @@ class ShinkToCenter(ShinkToPoint):
         self, mobject: Mobject, point_color: str = None, **kwargs
     ) -> None:
         point = mobject.get_center()
-        super().__init__(mobject, point, point_color=point_color, **kwargs)
\ No newline at end of file
+        super().__init__(mobject, point, point_color=point_color, **kwargs)
+
+
+class MoveAlongArcLength(Animation):
+    """
+    MoveAlongPath reading positions from the path's cached arc-length
+    table: every frame is a binary search instead of re-measuring each
+    curve of the path. The table is taken when the animation begins,
+    so the path should not change while it runs.
+    """
+    def __init__(
+        self, mobject: Mobject, path: VMobject, suspend_mobject_updating: bool = False, **kwargs
+    ) -> None:
+        self.path = path
+        super().__init__(mobject, suspend_mobject_updating=suspend_mobject_updating, **kwargs)
+
+    def begin(self) -> None:
+        self.table = get_arc_length_table(self.path)
+        super().begin()
+
+    def interpolate_mobject(self, alpha: float) -> None:
+        point = self.table.points_at(self.rate_func(alpha))
+        self.mobject.move_to(point)
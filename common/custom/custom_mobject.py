@@ -1,4 +1,7 @@
 from manim import *
+from common.utils.containment_utils import flatten_subpaths, points_in_polygons
+from common.utils.mobject_utils import GLYPH_CACHE
+from common.utils.random_utils import SceneRNG
 
 
 class TickDecimalNumber(VGroup):
@@ -37,3 +40,325 @@ class TickDecimalNumber(VGroup):
 
     def get_tick(self):
         return self.tick
+
+
+class AccumulatingLayer(PMobject):
+    """
+    Point layer that only grows: new elements are appended into
+    pre-allocated point and color buffers whose capacity doubles when
+    full. The scene sees a single mobject whatever the element count,
+    which suits sampling visualizations, traced paths and particle trails.
+
+    capacity: int
+        number of elements allocated up front
+    """
+
+    def __init__(self, capacity=1024, **kwargs):
+        super().__init__(**kwargs)
+        self.point_buffer = np.zeros((capacity, 3))
+        self.rgba_buffer = np.zeros((capacity, 4))
+        self.count = 0
+        self._sync()
+
+    def _sync(self):
+        self.points = self.point_buffer[:self.count]
+        self.rgbas = self.rgba_buffer[:self.count]
+
+    def _absorb(self):
+        # Transformations such as shift may replace the point arrays
+        # instead of writing into the buffers, copy them back first.
+        if not np.shares_memory(self.points, self.point_buffer):
+            self.point_buffer[:self.count] = self.points
+        if not np.shares_memory(self.rgbas, self.rgba_buffer):
+            self.rgba_buffer[:self.count] = self.rgbas
+
+    def _reserve(self, n):
+        needed = self.count + n
+        capacity = len(self.point_buffer)
+        if needed <= capacity:
+            return
+        capacity = max(needed, 2 * capacity)
+        point_buffer = np.zeros((capacity, 3))
+        rgba_buffer = np.zeros((capacity, 4))
+        point_buffer[:self.count] = self.point_buffer[:self.count]
+        rgba_buffer[:self.count] = self.rgba_buffer[:self.count]
+        self.point_buffer = point_buffer
+        self.rgba_buffer = rgba_buffer
+
+    def append(self, points, rgbas=None, color=None, opacity=1):
+        points = np.atleast_2d(np.asarray(points, dtype=float))
+        n = len(points)
+        if n == 0:
+            return self
+        if rgbas is None:
+            rgbas = color_to_rgba(color or self.color, opacity)
+        self._absorb()
+        self._reserve(n)
+        self.point_buffer[self.count:self.count + n] = points
+        self.rgba_buffer[self.count:self.count + n] = rgbas
+        self.count += n
+        self._sync()
+        return self
+
+    def clear(self):
+        self.count = 0
+        self._sync()
+        return self
+
+    def add_tracker_updater(self, tracker, generate):
+        """
+        Keeps the layer at int(tracker.get_value()) elements, appending
+        only the missing ones each frame. generate(n) returns their
+        points and rgbas.
+        """
+
+        def update(layer):
+            missing = int(tracker.get_value()) - layer.count
+            if missing > 0:
+                layer.append(*generate(missing))
+
+        return self.add_updater(update)
+
+
+class MonteCarloArea(AccumulatingLayer):
+    """
+    Monte Carlo estimate of the area of a shape, drawn as a single
+    point cloud. Samples are drawn and classified in NumPy batches, so
+    the frame cost does not depend on how many samples were taken.
+    """
+
+    def __init__(self, shape, x_range=(-2.5, 2.5), y_range=(-2.5, 2.5),
+                 inside_color=ORANGE, outside_color=WHITE, fill_rule="evenodd",
+                 seed=None, stroke_width=2, **kwargs):
+        super().__init__(stroke_width=stroke_width, **kwargs)
+        self.x_range = x_range
+        self.y_range = y_range
+        self.inside_rgba = color_to_rgba(inside_color)
+        self.outside_rgba = color_to_rgba(outside_color)
+        self.fill_rule = fill_rule
+        self.polygons = flatten_subpaths(shape)
+        self.rng = seed if isinstance(seed, SceneRNG) else SceneRNG(seed)
+        self.num_samples = 0
+        self.num_inside = 0
+
+    def generate_elements(self, n):
+        points = self.rng.uniform_in_box(n, self.x_range, self.y_range)
+        inside = points_in_polygons(points, self.polygons, self.fill_rule)
+        self.num_samples += n
+        self.num_inside += int(inside.sum())
+        return points, np.where(inside[:, np.newaxis], self.inside_rgba, self.outside_rgba)
+
+    def add_samples(self, n):
+        if n <= 0:
+            return self
+        return self.append(*self.generate_elements(n))
+
+    def add_tracker_updater(self, tracker, generate=None):
+        return super().add_tracker_updater(tracker, generate or self.generate_elements)
+
+    def clear(self):
+        self.num_samples = 0
+        self.num_inside = 0
+        return super().clear()
+
+    def sample_to(self, total):
+        return self.add_samples(int(total) - self.num_samples)
+
+    def get_box_area(self):
+        return (self.x_range[1] - self.x_range[0]) * (self.y_range[1] - self.y_range[0])
+
+    def get_estimate(self):
+        if self.num_samples == 0:
+            return 0
+        return self.get_box_area() * self.num_inside / self.num_samples
+
+
+class GlyphNumber(VGroup):
+    """
+    Numeric label built from cached digit glyphs and updated in place:
+    set_value only copies glyph points into reused slots, so live
+    counters never go back through the text renderer.
+
+    number_format: str
+        format string such as "{}" or "{:.5f}", digits, "." and "-" only
+    aligned_edge: np.ndarray
+        point of the label kept fixed when its width changes
+    """
+
+    def __init__(self, number=0, number_format="{}", font="Arial", font_size=30,
+                 color=WHITE, aligned_edge=ORIGIN, **kwargs):
+        super().__init__(**kwargs)
+        self.number_format = number_format
+        self.aligned_edge = aligned_edge
+        self.glyphs, self.spacing = GLYPH_CACHE.get_glyphs(font, font_size, color)
+        self.glyph_scale = 1
+        self.slots = []
+        self.text = None
+        self.set_value(number)
+
+    def scale(self, scale_factor, **kwargs):
+        self.glyph_scale *= scale_factor
+        return super().scale(scale_factor, **kwargs)
+
+    def set_value(self, number):
+        text = self.number_format.format(number)
+        self.number = number
+        if text == self.text:
+            return self
+        anchor = self.get_critical_point(self.aligned_edge)
+        while len(self.slots) < len(text):
+            self.slots.append(self.glyphs["0"].copy())
+
+        x = 0
+        for slot, char in zip(self.slots, text):
+            glyph = self.glyphs[char]
+            left = glyph.get_left()[0]
+            slot.points = (glyph.points - left * RIGHT) * self.glyph_scale + x * RIGHT
+            x += (glyph.width + self.spacing) * self.glyph_scale
+        self.submobjects = self.slots[:len(text)]
+        if self.text is not None:
+            self.shift(anchor - self.get_critical_point(self.aligned_edge))
+        self.text = text
+        return self
+
+    def get_value(self):
+        return self.number
+
+
+class InstancedMobject(VMobject):
+    """
+    Many copies of one template shape, stored as compact per-instance
+    arrays (x, y, scale, angle and rgba: 8 floats per instance) instead
+    of one mobject each. The copies are drawn as one batched VMobject
+    per distinct color, rebuilt only after the instances change. The
+    batches hold the full points of every instance, so the saving is in
+    mobject count and rebuild cost, not in point memory.
+
+    template: VMobject
+        the shape to repeat, its points are centered on the origin and
+        its opacities, stroke width and background stroke are kept
+    positions: (n, 2) or (n, 3) array
+        instance centers, z is ignored
+    scales, angles: float or (n,) array
+        per-instance scale factor and rotation in radians
+    colors: color, list of n colors or (n, 3) rgb array, optional
+        the template color by default
+    opacities: float or (n,) array
+        multiplied with the template fill and stroke opacities
+
+    shift, scale and rotate (about the z axis, with uniform factors)
+    act on the instance arrays. Other point functions act on the
+    batched VMobjects only and are lost at the next rebuild.
+    """
+
+    def __init__(self, template, positions=None, scales=1, angles=0,
+                 colors=None, opacities=1, **kwargs):
+        points = np.concatenate([mob.points for mob in template.family_members_with_points()])
+        self.template_points = points - template.get_center()
+        self.template = template.copy()
+        self.template_color = template.get_color()
+        self.fill_opacity_factor = template.get_fill_opacity()
+        self.stroke_opacity_factor = template.get_stroke_opacity()
+        self.positions = np.zeros((0, 2))
+        self.scales = np.zeros(0)
+        self.angles = np.zeros(0)
+        self.rgbas = np.zeros((0, 4))
+        self._dirty = True
+        super().__init__(**kwargs)
+        if positions is not None:
+            self.add_instances(positions, scales, angles, colors, opacities)
+
+    def get_num_instances(self):
+        return len(self.scales)
+
+    def _as_rgbas(self, colors, opacities, n):
+        if colors is None:
+            colors = self.template_color
+        if isinstance(colors, np.ndarray) and colors.ndim == 2:
+            rgbs = colors[:, :3]
+        elif isinstance(colors, (list, tuple)) and len(colors) == n and not isinstance(colors[0], float):
+            rgbs = np.array([color_to_rgb(color) for color in colors])
+        else:
+            rgbs = np.tile(color_to_rgb(colors), (n, 1))
+        alphas = np.broadcast_to(np.asarray(opacities, dtype=float), (n,))
+        return np.column_stack([rgbs, alphas])
+
+    def add_instances(self, positions, scales=1, angles=0, colors=None, opacities=1):
+        positions = np.atleast_2d(np.asarray(positions, dtype=float))[:, :2]
+        n = len(positions)
+        self.positions = np.concatenate([self.positions, positions])
+        self.scales = np.concatenate([self.scales, np.broadcast_to(scales, (n,))])
+        self.angles = np.concatenate([self.angles, np.broadcast_to(angles, (n,))])
+        self.rgbas = np.concatenate([self.rgbas, self._as_rgbas(colors, opacities, n)])
+        return self.mark_dirty()
+
+    def set_positions(self, positions):
+        self.positions = np.asarray(positions, dtype=float)[:, :2].copy()
+        return self.mark_dirty()
+
+    def set_instance_colors(self, colors, opacities=None):
+        if opacities is None:
+            opacities = self.rgbas[:, 3]
+        self.rgbas = self._as_rgbas(colors, opacities, self.get_num_instances())
+        return self.mark_dirty()
+
+    def mark_dirty(self):
+        self._dirty = True
+        return self
+
+    def get_instance_points(self):
+        """Points of every instance, shape (n, k, 3)."""
+        cos = np.cos(self.angles)[:, np.newaxis]
+        sin = np.sin(self.angles)[:, np.newaxis]
+        scales = self.scales[:, np.newaxis]
+        tx, ty, tz = self.template_points.T
+        points = np.empty((self.get_num_instances(), len(self.template_points), 3))
+        points[:, :, 0] = self.positions[:, 0:1] + scales * (cos * tx - sin * ty)
+        points[:, :, 1] = self.positions[:, 1:2] + scales * (sin * tx + cos * ty)
+        points[:, :, 2] = scales * tz
+        return points
+
+    def materialize(self):
+        self._dirty = False
+        if self.get_num_instances() == 0:
+            self.submobjects = []
+            return self
+        points = self.get_instance_points()
+        rgbas, inverse = np.unique(self.rgbas, axis=0, return_inverse=True)
+        inverse = inverse.ravel()
+        batches = []
+        for index, rgba in enumerate(rgbas):
+            batch = VMobject().match_style(self.template)
+            batch.points = points[inverse == index].reshape(-1, 3)
+            batch.fill_rgbas = np.array([[*rgba[:3], rgba[3] * self.fill_opacity_factor]])
+            batch.stroke_rgbas = np.array([[*rgba[:3], rgba[3] * self.stroke_opacity_factor]])
+            batches.append(batch)
+        self.submobjects = batches
+        return self
+
+    def get_family(self, recurse=True):
+        if self.__dict__.get("_dirty"):
+            self.materialize()
+        return super().get_family(recurse)
+
+    def shift(self, *vectors):
+        self.positions += np.sum(vectors, axis=0)[:2]
+        return self.mark_dirty()
+
+    def scale(self, scale_factor, about_point=None, about_edge=ORIGIN, **kwargs):
+        if about_point is None:
+            about_point = self.get_critical_point(about_edge)
+        self.positions = about_point[:2] + (self.positions - about_point[:2]) * scale_factor
+        self.scales = self.scales * scale_factor
+        return self.mark_dirty()
+
+    def rotate(self, angle, axis=OUT, about_point=None, **kwargs):
+        if not np.allclose(normalize(axis), OUT):
+            raise NotImplementedError("InstancedMobject only rotates about the z axis")
+        if about_point is None:
+            about_point = self.get_center()
+        offsets = self.positions - about_point[:2]
+        cos, sin = np.cos(angle), np.sin(angle)
+        self.positions = about_point[:2] + offsets @ np.array([[cos, sin], [-sin, cos]])
+        self.angles = self.angles + angle
+        return self.mark_dirty()
@@ -1,52 +1,134 @@
+from functools import lru_cache
+
 from manim import *
+from common.utils.curve_utils import cubic_bernstein
 
 
 def parabola(t, amp=1):
     return (1 - (2 * t - 1) ** 2) * amp
 
 
-def rate_func_from_bezier(handles, start_end=[0, 1], partitions=100):
-    def simple_cubic_bezier(x1, y1, x2, y2):
-        return bezier([
-            np.array([0, start_end[0], 0]),
-            np.array([x1, y1, 0]),
-            np.array([x2, y2, 0]),
-            np.array([1, start_end[1], 0]),
-        ])
-
-    def line_between_points(t, x1, x2, y1, y2):
-        return (y2 - y1) * (t - x1) / (x2 - x1) + y1
-
-    def closure_func(func, partitions=100):
-        dt = 1 / partitions
-        t_range = np.arange(0, 1 + dt, dt)
-        x_range = [func(t)[0] for t in t_range]
-        y_range = [func(t)[1] for t in t_range]
-
-        x_steps = [
-            (x_range[i], x_range[i + 1])
-            for i in range(len(x_range) - 1)
-        ]
-
-        y_steps = [
-            (y_range[i], y_range[i + 1])
-            for i in range(len(y_range) - 1)
-        ]
-
-        def f(t):
-            if t <= 0:
-                return start_end[0]
-            if t >= 1:
-                return start_end[1]
-
-            for i in range(len(x_range)):
-                x1, x2 = x_steps[i]
-                y1, y2 = y_steps[i]
-                if x1 <= t <= x2:
-                    return line_between_points(t, x1, x2, y1, y2)
-
-        return f
-
-    parametric_bezier = simple_cubic_bezier(*handles)
-    cartesian_bezier = closure_func(parametric_bezier, partitions)
-    return cartesian_bezier
\ No newline at end of file
+class BezierRateFunc:
+    """
+    Rate function following a cubic Bezier easing curve, precompiled
+    into a monotone x -> y lookup table.
+
+    handles: [x1, y1, x2, y2]
+        inner control points, as in CSS cubic-bezier
+    start_end: [y0, y3]
+        values of the rate function at t = 0 and t = 1
+    partitions: int
+        number of linear segments in the lookup table
+
+    Calls accept floats as well as arrays of t values.
+    """
+
+    def __init__(self, handles, start_end=(0, 1), partitions=100):
+        x1, y1, x2, y2 = handles
+        self.handles = tuple(handles)
+        self.start_end = tuple(start_end)
+        self.partitions = partitions
+        weights = cubic_bernstein(np.linspace(0, 1, partitions + 1))
+        self.x_table = np.maximum.accumulate(weights @ np.array([0, x1, x2, 1]))
+        self.y_table = weights @ np.array([start_end[0], y1, y2, start_end[1]])
+
+    def __call__(self, t):
+        y = np.interp(t, self.x_table, self.y_table,
+                      left=self.start_end[0], right=self.start_end[1])
+        if np.ndim(y) == 0:
+            return float(y)
+        return y
+
+
+class CubicBezierRateFunc:
+    """
+    Exact cubic Bezier easing, solved like CSS cubic-bezier: x(s) = t
+    is inverted per query with Newton iterations, falling back to
+    bisection where Newton does not converge.
+
+    handles: [x1, y1, x2, y2]
+        inner control points, x1 and x2 must lie in [0, 1]
+    start_end: [y0, y3]
+        values of the rate function at t = 0 and t = 1
+    tolerance: float
+        accepted error on x(s) before the bisection fallback kicks in
+    """
+
+    def __init__(self, handles, start_end=(0, 1), tolerance=1e-7,
+                 newton_iterations=8, bisection_iterations=50):
+        x1, y1, x2, y2 = handles
+        self.handles = tuple(handles)
+        self.start_end = tuple(start_end)
+        self.tolerance = tolerance
+        self.newton_iterations = newton_iterations
+        self.bisection_iterations = bisection_iterations
+        self.x_controls = np.array([0, x1, x2, 1], dtype=float)
+        self.y_controls = np.array([start_end[0], y1, y2, start_end[1]], dtype=float)
+
+    def x_of(self, s):
+        return cubic_bernstein(s) @ self.x_controls
+
+    def y_of(self, s):
+        return cubic_bernstein(s) @ self.y_controls
+
+    def dx_of(self, s):
+        c = self.x_controls
+        s = np.asarray(s, dtype=float)
+        return 3 * ((1 - s) ** 2 * (c[1] - c[0])
+                    + 2 * (1 - s) * s * (c[2] - c[1])
+                    + s ** 2 * (c[3] - c[2]))
+
+    def solve_parameter(self, t):
+        """Curve parameter s with x(s) = t, for a float or an array of t in [0, 1]."""
+        shape = np.shape(t)
+        t = np.clip(np.atleast_1d(np.asarray(t, dtype=float)), 0, 1)
+        s = t.copy()
+        for _ in range(self.newton_iterations):
+            dx = self.dx_of(s)
+            steep = np.abs(dx) > 1e-6
+            s = np.where(steep, s - (self.x_of(s) - t) / np.where(steep, dx, 1), s)
+        s = np.clip(s, 0, 1)
+
+        unsolved = np.abs(self.x_of(s) - t) > self.tolerance
+        if np.any(unsolved):
+            target = t[unsolved]
+            low = np.zeros_like(target)
+            high = np.ones_like(target)
+            for _ in range(self.bisection_iterations):
+                mid = (low + high) / 2
+                below = self.x_of(mid) < target
+                low = np.where(below, mid, low)
+                high = np.where(below, high, mid)
+            s[unsolved] = (low + high) / 2
+        return s.reshape(shape)
+
+    def __call__(self, t):
+        t = np.asarray(t, dtype=float)
+        y = self.y_of(self.solve_parameter(t))
+        y = np.where(t <= 0, self.start_end[0], np.where(t >= 1, self.start_end[1], y))
+        if np.ndim(y) == 0:
+            return float(y)
+        return y
+
+    def max_error(self, resolution=100000):
+        """Largest deviation from a densely sampled reference of the curve."""
+        s = np.linspace(0, 1, resolution)
+        return float(np.max(np.abs(self(self.x_of(s)) - self.y_of(s))))
+
+
+@lru_cache(maxsize=None)
+def _compiled_rate_func(handles, start_end, partitions, method):
+    if method == "table":
+        return BezierRateFunc(handles, start_end, partitions)
+    if method == "exact":
+        return CubicBezierRateFunc(handles, start_end)
+    raise ValueError(f"method must be 'table' or 'exact', got {method!r}")
+
+
+def rate_func_from_bezier(handles, start_end=[0, 1], partitions=100, method="table"):
+    """
+    method: "table" or "exact"
+        "table" interpolates a precomputed table of partitions segments,
+        "exact" solves the curve per query and ignores partitions
+    """
+    return _compiled_rate_func(tuple(handles), tuple(start_end), partitions, method)
\ No newline at end of file
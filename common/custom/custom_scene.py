@@ -0,0 +1,165 @@
+import inspect
+import json
+import os
+import time
+from collections import defaultdict
+
+from manim import *
+
+
+class _ProfiledUpdater:
+    # Times an updater while still comparing equal to it,
+    # so remove_updater(original) keeps working.
+    def __init__(self, updater, label, profiler):
+        self.updater = updater
+        self.label = label
+        self.profiler = profiler
+        self.__wrapped__ = updater
+        self.__signature__ = inspect.signature(updater)
+
+    def __call__(self, *args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return self.updater(*args, **kwargs)
+        finally:
+            self.profiler._record_updater(self.label, time.perf_counter() - start)
+
+    def __eq__(self, other):
+        return other is self or other == self.updater
+
+    def __hash__(self):
+        return hash(self.updater)
+
+
+class ProfilingMixin:
+    """
+    Opt-in per-frame profiling for a Scene:
+
+        class Scene7(ProfilingMixin, MyScene):
+            ...
+
+    Every frame records the time spent in updaters (and in each updater),
+    in drawing the frame, in writing it to the movie pipe, plus the
+    number of mobjects in the scene. When the scene finishes, a JSON
+    report and a flamegraph-compatible folded-stack file are written to
+    <media_dir>/profiles/.
+    """
+
+    def render(self, *args, **kwargs):
+        self._start_profiling()
+        try:
+            return super().render(*args, **kwargs)
+        finally:
+            self._write_profile()
+
+    def _start_profiling(self):
+        self.profile_frames = []
+        self.profile_updaters = defaultdict(lambda: {"calls": 0, "time": 0.0})
+        self._pending = defaultdict(float)
+        self._pending_updaters = defaultdict(float)
+        self._profile_start = time.perf_counter()
+
+        renderer = self.renderer
+        render_frame = renderer.render
+        update_frame = renderer.update_frame
+        add_frame = renderer.add_frame
+
+        def timed(phase, method):
+            def wrapper(*args, **kwargs):
+                start = time.perf_counter()
+                try:
+                    return method(*args, **kwargs)
+                finally:
+                    self._pending[phase] += time.perf_counter() - start
+            return wrapper
+
+        def profiled_render(scene, frame_time, moving_mobjects):
+            start = time.perf_counter()
+            try:
+                return render_frame(scene, frame_time, moving_mobjects)
+            finally:
+                self._record_frame(frame_time, time.perf_counter() - start)
+
+        renderer.update_frame = timed("draw", update_frame)
+        renderer.add_frame = timed("write", add_frame)
+        renderer.render = profiled_render
+
+    def _record_updater(self, label, elapsed):
+        stats = self.profile_updaters[label]
+        stats["calls"] += 1
+        stats["time"] += elapsed
+        self._pending_updaters[label] += elapsed
+
+    def _record_frame(self, frame_time, render_time):
+        self.profile_frames.append({
+            "index": len(self.profile_frames),
+            "time": frame_time,
+            "updaters": self._pending["updaters"],
+            "draw": self._pending["draw"],
+            "write": self._pending["write"],
+            "render": render_time,
+            "mobjects": len(self.get_mobject_family_members()),
+            "updater_times": dict(self._pending_updaters),
+        })
+        self._pending.clear()
+        self._pending_updaters.clear()
+
+    def _wrap_updaters(self):
+        for mob in self.get_mobject_family_members():
+            for i, updater in enumerate(mob.updaters):
+                if not isinstance(updater, _ProfiledUpdater):
+                    label = f"{type(mob).__name__}.{getattr(updater, '__qualname__', repr(updater))}"
+                    mob.updaters[i] = _ProfiledUpdater(updater, label, self)
+
+    def update_mobjects(self, dt):
+        self._wrap_updaters()
+        start = time.perf_counter()
+        try:
+            return super().update_mobjects(dt)
+        finally:
+            self._pending["updaters"] += time.perf_counter() - start
+
+    def get_profile(self):
+        total = time.perf_counter() - self._profile_start
+        phases = {
+            phase: sum(frame[phase] for frame in self.profile_frames)
+            for phase in ("updaters", "draw", "write")
+        }
+        framed = phases["updaters"] + sum(frame["render"] for frame in self.profile_frames)
+        return {
+            "scene": type(self).__name__,
+            "total_time": total,
+            "frame_count": len(self.profile_frames),
+            "phases": {**phases, "construct": total - framed},
+            "updaters": dict(self.profile_updaters),
+            "frames": self.profile_frames,
+        }
+
+    def get_folded_stacks(self, profile):
+        """Folded stacks in microseconds, for flamegraph.pl or speedscope."""
+        scene = profile["scene"]
+        phases = profile["phases"]
+        attributed = 0
+        lines = []
+        for label, stats in profile["updaters"].items():
+            attributed += stats["time"]
+            lines.append(f"{scene};updaters;{label} {int(stats['time'] * 1e6)}")
+        lines.append(f"{scene};updaters;(scene) {int(max(phases['updaters'] - attributed, 0) * 1e6)}")
+        for phase in ("draw", "write", "construct"):
+            lines.append(f"{scene};{phase} {int(max(phases[phase], 0) * 1e6)}")
+        return "\n".join(lines) + "\n"
+
+    def _write_profile(self):
+        profile = self.get_profile()
+        directory = os.path.join(config.media_dir, "profiles")
+        os.makedirs(directory, exist_ok=True)
+        path = os.path.join(directory, profile["scene"])
+        with open(path + ".json", "w") as file:
+            json.dump(profile, file, indent=1)
+        with open(path + ".folded", "w") as file:
+            file.write(self.get_folded_stacks(profile))
+        logger.info(f"Profile of {profile['scene']} written to {path}.json")
+
+
+class ProfiledScene(ProfilingMixin, Scene):
+    pass
@@ -0,0 +1,251 @@
+"""
+Renders every Scene subclass found under the given directories, in
+scene modules and in the code cells of Jupyter notebooks, in one
+long-lived process, or across a pool of worker processes, instead of
+one `manim` shell invocation per scene. See notebook_source for how
+notebooks are turned into modules.
+
+    python -m common.render.batch_render source notebooks --workers 8 -q l
+"""
+import argparse
+import ast
+import importlib.util
+import os
+import sys
+import time
+import traceback
+import types
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+
+from common.render.notebook_source import NOTEBOOK_SUFFIX, read_source
+from common.render.scene_hash import RenderManifest, scene_fingerprint
+
+ROOT = Path(__file__).resolve().parents[2]
+
+QUALITIES = {
+    "l": "low_quality",
+    "m": "medium_quality",
+    "h": "high_quality",
+    "p": "production_quality",
+    "k": "fourk_quality",
+}
+
+SKIPPED_DIRS = {"common", "media", "output", "__pycache__", ".git", ".ipynb_checkpoints"}
+
+
+@dataclass
+class SceneJob:
+    path: Path
+    scene_name: str
+
+
+@dataclass
+class SceneResult:
+    path: Path
+    scene_name: str
+    wall_time: float
+    load_time: float = 0
+    output: str = None
+    error: str = None
+
+
+def find_scene_files(directories):
+    for directory in directories:
+        paths = Path(directory).resolve().rglob("*")
+        for path in sorted(path for path in paths if path.suffix in (".py", NOTEBOOK_SUFFIX)):
+            if not SKIPPED_DIRS.intersection(path.relative_to(ROOT).parts[:-1]):
+                yield path
+
+
+def find_scene_names(path):
+    """
+    Scene classes of a module, found from its syntax tree so that nothing
+    is imported: classes deriving from a *Scene base, minus the helper
+    bases (such as MyScene) that other scenes of the module derive from.
+    """
+    tree = ast.parse(read_source(path))
+    classes = [node for node in tree.body if isinstance(node, ast.ClassDef)]
+    scenes = []
+    helpers = set()
+    for node in classes:
+        bases = [base.attr if isinstance(base, ast.Attribute) else getattr(base, "id", "")
+                 for base in node.bases]
+        if any(base.endswith("Scene") or base in scenes for base in bases):
+            scenes.append(node.name)
+            helpers.update(base for base in bases if base in scenes)
+    return [name for name in dict.fromkeys(scenes) if name not in helpers]
+
+
+def find_jobs(directories, scene_names=None):
+    jobs = []
+    for path in find_scene_files(directories):
+        try:
+            names = find_scene_names(path)
+        except SyntaxError:
+            continue
+        jobs.extend(SceneJob(path, name) for name in names
+                    if not scene_names or name in scene_names)
+    return jobs
+
+
+@contextmanager
+def working_directory(path):
+    previous = os.getcwd()
+    os.chdir(path)
+    try:
+        yield
+    finally:
+        os.chdir(previous)
+
+
+def load_module(path):
+    """
+    Imports a scene module or notebook by path, with the repo root and
+    its folder importable.
+    """
+    path = Path(path).resolve()
+    for directory in (str(ROOT), str(path.parent)):
+        if directory not in sys.path:
+            sys.path.insert(0, directory)
+    name = "scenes." + ".".join(path.relative_to(ROOT).with_suffix("").parts)
+    if path.suffix == NOTEBOOK_SUFFIX:
+        module = types.ModuleType(name)
+        module.__file__ = str(path)
+        sys.modules[name] = module
+        exec(compile(read_source(path), str(path), "exec"), module.__dict__)
+        return module
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def get_config_options(quality="l", disable_caching=False):
+    return {
+        "quality": QUALITIES[quality],
+        "disable_caching": disable_caching,
+        "preview": False,
+    }
+
+
+def apply_config(path, options, config_file=None):
+    """
+    Digests the given config file, or else the manim.cfg next to the
+    scene module, then applies the render options on top.
+    """
+    from manim import config
+
+    path = Path(path)
+    if config_file:
+        config.digest_file(config_file)
+    elif (path.parent / "manim.cfg").exists():
+        config.digest_file(path.parent / "manim.cfg")
+    config.update(options)
+
+
+def render_scene(job, options, config_file=None, module_loader=load_module):
+    """
+    Renders one scene inside a temporary config, from the folder of its
+    module so that relative assets and media paths behave like the CLI.
+    """
+    from manim import tempconfig
+
+    start = time.perf_counter()
+    load_time = 0
+    path = Path(job.path)
+    try:
+        with working_directory(path.parent), tempconfig({}):
+            apply_config(path, options, config_file)
+            module = module_loader(path)
+            load_time = time.perf_counter() - start
+            scene = getattr(module, job.scene_name)()
+            scene.render()
+            output = getattr(scene.renderer.file_writer, "movie_file_path", None)
+            output = os.path.abspath(output) if output else None
+        return SceneResult(path, job.scene_name, time.perf_counter() - start, load_time,
+                           output=output)
+    except Exception:
+        return SceneResult(path, job.scene_name, time.perf_counter() - start, load_time,
+                           error=traceback.format_exc())
+
+
+def render_jobs(jobs, options, workers=1, config_file=None):
+    """Renders the jobs in this process, or across `workers` processes."""
+    if workers <= 1:
+        for job in jobs:
+            yield render_scene(job, options, config_file)
+        return
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(render_scene, job, options, config_file) for job in jobs]
+        for future in as_completed(futures):
+            yield future.result()
+
+
+def print_report(results, total_time, skipped=()):
+    failed = [r for r in results if r.error]
+    for job in skipped:
+        print(f"{'':9}  {'skip':6}  {job.path.relative_to(ROOT)}::{job.scene_name}")
+    for r in sorted(results, key=lambda r: r.wall_time, reverse=True):
+        status = "FAILED" if r.error else "ok"
+        print(f"{r.wall_time:8.2f}s  {status:6}  {r.path.relative_to(ROOT)}::{r.scene_name}")
+    for r in failed:
+        print(f"\n--- {r.path.relative_to(ROOT)}::{r.scene_name}\n{r.error}")
+    print(f"\n{len(results)} scenes rendered, {len(skipped)} unchanged, "
+          f"{len(failed)} failed, {total_time:.2f}s wall time")
+
+
+def get_parser():
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("directories", nargs="*", default=["source", "notebooks"],
+                        help="folders searched for scenes in .py modules and .ipynb notebooks, "
+                             "a scene defined in several notebook cells is rendered once, "
+                             "from its last definition")
+    parser.add_argument("-s", "--scene", action="append", dest="scenes",
+                        help="only render scenes with this name, can be repeated")
+    parser.add_argument("-q", "--quality", choices=QUALITIES, default="l")
+    parser.add_argument("-w", "--workers", type=int, default=os.cpu_count(),
+                        help="number of render processes, 1 renders in this process")
+    parser.add_argument("-c", "--config_file", help="manim .cfg file applied to every scene")
+    parser.add_argument("--disable_caching", action="store_true")
+    parser.add_argument("--manifest", default=str(ROOT / "media" / "render_manifest.json"),
+                        help="record of scene fingerprints used to skip unchanged scenes")
+    parser.add_argument("-f", "--force", action="store_true",
+                        help="render every scene, even when its fingerprint is unchanged")
+    return parser
+
+
+def main(argv=None):
+    args = get_parser().parse_args(argv)
+    jobs = find_jobs(args.directories, args.scenes)
+    options = get_config_options(args.quality, args.disable_caching)
+    config_file = os.path.abspath(args.config_file) if args.config_file else None
+
+    manifest = RenderManifest(args.manifest)
+    fingerprints = {(job.path, job.scene_name): scene_fingerprint(job, options, config_file)
+                    for job in jobs}
+    skipped = [] if args.force else [
+        job for job in jobs if manifest.is_fresh(job, fingerprints[job.path, job.scene_name])
+    ]
+    jobs = [job for job in jobs if job not in skipped]
+
+    start = time.perf_counter()
+    results = []
+    for result in render_jobs(jobs, options, args.workers, config_file):
+        print(f"[{len(results) + 1}/{len(jobs)}] {result.scene_name} "
+              f"{'FAILED' if result.error else 'done'} in {result.wall_time:.2f}s")
+        results.append(result)
+        if not result.error:
+            job = SceneJob(result.path, result.scene_name)
+            manifest.record(job, fingerprints[result.path, result.scene_name], result.output)
+            manifest.save()
+    print_report(results, time.perf_counter() - start, skipped)
+    return 1 if any(r.error for r in results) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
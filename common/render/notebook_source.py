@@ -0,0 +1,54 @@
+"""
+Jupyter notebooks as scene modules: the code cells of a notebook are
+joined, in order, into the source of one module. IPython magic and
+shell lines (%%manim ..., %matplotlib, !pip) are dropped, so a
+%%manim cell contributes only its Python body. Cells with another
+cell magic (%%bash, %%html) or that do not parse are left out.
+
+Each notebook becomes a single module, so a scene class defined in
+several cells is found and rendered once, from its last definition.
+"""
+import ast
+import json
+from pathlib import Path
+
+NOTEBOOK_SUFFIX = ".ipynb"
+PYTHON_CELL_MAGICS = {"manim", "time", "capture"}
+
+
+def _cell_body(lines):
+    code = [line for line in lines if line.strip()]
+    if code and code[0].lstrip().startswith("%%"):
+        magic = code[0].lstrip()[2:].split(maxsplit=1)
+        if not magic or magic[0] not in PYTHON_CELL_MAGICS:
+            return None
+    return "".join("\n" if line.lstrip().startswith(("%", "!")) else line for line in lines)
+
+
+def notebook_source(path):
+    """Python source of the code cells of a notebook."""
+    notebook = json.loads(Path(path).read_text(encoding="utf-8"))
+    cells = []
+    for index, cell in enumerate(notebook.get("cells", [])):
+        if cell.get("cell_type") != "code":
+            continue
+        source = cell.get("source", "")
+        lines = source if isinstance(source, list) else source.splitlines(keepends=True)
+        lines = [line if line.endswith("\n") else line + "\n" for line in lines]
+        body = _cell_body(lines)
+        if body is None:
+            continue
+        try:
+            ast.parse(body)
+        except SyntaxError:
+            continue
+        cells.append(f"# In[{index}]:\n{body}")
+    return "\n".join(cells)
+
+
+def read_source(path):
+    """Source of a scene module, or of the code cells of a notebook."""
+    path = Path(path)
+    if path.suffix == NOTEBOOK_SUFFIX:
+        return notebook_source(path)
+    return path.read_text(encoding="utf-8")
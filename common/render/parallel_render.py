@@ -0,0 +1,231 @@
+"""
+Renders one long scene on several cores: the timeline is split into
+segments of consecutive play/wait calls, every worker fast-forwards the
+scene to its segment (manim's from/upto animation numbers) and renders
+only that part, then the segment movies are concatenated.
+
+    python -m common.render.parallel_render source/svg/test_load_svg.py Scene7 \
+        -c source/svg/production.cfg -w 8 --seed 0
+
+Workers rebuild the scene state by re-running construct, so the scene
+must be deterministic. Two skipping passes are compared before any
+frame is rendered, and the state at every segment boundary is compared
+between the two workers sharing it; a scene drawing unseeded random
+numbers fails with NondeterministicSceneError. --seed seeds `random`,
+`numpy.random` and the SceneRNG of every worker before the scene is
+built.
+"""
+import argparse
+import hashlib
+import os
+import random
+import subprocess
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+
+from common.render.batch_render import (
+    QUALITIES,
+    SceneJob,
+    apply_config,
+    get_config_options,
+    load_module,
+    working_directory,
+)
+from common.utils.random_utils import SEED_ENVIRONMENT_VARIABLE
+
+
+class NondeterministicSceneError(Exception):
+    pass
+
+
+@dataclass
+class Segment:
+    index: int
+    first: int
+    last: int
+    output: str = None
+    start_state: str = None
+    end_state: str = None
+    wall_time: float = 0
+
+
+def seed_randomness(seed):
+    if seed is not None:
+        random.seed(seed)
+        np.random.seed(seed)
+        os.environ[SEED_ENVIRONMENT_VARIABLE] = str(seed)
+
+
+def state_fingerprint(scene):
+    """Hash of the points of every mobject in the scene, rounded to absorb float noise."""
+    digest = hashlib.sha1()
+    for mob in scene.get_mobject_family_members():
+        digest.update(type(mob).__name__.encode())
+        digest.update((np.round(mob.points, 6) + 0.0).tobytes())
+    return digest.hexdigest()
+
+
+def run_scene(job, options, config_file=None, seed=None, on_play=None):
+    """
+    Builds and renders a scene like batch_render.render_scene, seeding
+    randomness first. on_play(scene, play_index) is called before
+    every play/wait call.
+    """
+    from manim import tempconfig
+
+    path = Path(job.path)
+    with working_directory(path.parent), tempconfig({}):
+        apply_config(path, options, config_file)
+        module = load_module(path)
+        seed_randomness(seed)
+        scene = getattr(module, job.scene_name)()
+        if on_play is not None:
+            renderer = scene.renderer
+            play = renderer.play
+
+            def hooked_play(scene, *args, **kwargs):
+                on_play(scene, renderer.num_plays)
+                return play(scene, *args, **kwargs)
+
+            renderer.play = hooked_play
+        scene.render()
+        output = getattr(scene.renderer.file_writer, "movie_file_path", None)
+        return scene, os.path.abspath(output) if output else None
+
+
+def plan_scene(job, options, config_file=None, seed=None):
+    """
+    Number of play/wait calls and final state fingerprint, from a pass
+    that skips every animation.
+    """
+    options = {
+        **options,
+        "write_to_movie": False,
+        "save_last_frame": False,
+        "from_animation_number": sys.maxsize,
+    }
+    scene, _ = run_scene(job, options, config_file, seed)
+    return scene.renderer.num_plays, state_fingerprint(scene)
+
+
+def split_segments(num_plays, num_segments):
+    chunks = np.array_split(np.arange(num_plays), min(num_segments, num_plays))
+    return [Segment(i, int(chunk[0]), int(chunk[-1])) for i, chunk in enumerate(chunks)]
+
+
+def render_segment(job, options, config_file, seed, segment, media_dir):
+    start = time.perf_counter()
+    options = {
+        **options,
+        "from_animation_number": segment.first,
+        "upto_animation_number": segment.last,
+        "media_dir": media_dir,
+        "disable_caching": True,
+    }
+
+    def on_play(scene, index):
+        if index == segment.first and segment.start_state is None:
+            segment.start_state = state_fingerprint(scene)
+        if index > segment.last:
+            # upto_animation_number = 0 reads as "no limit" in manim
+            from manim.utils.exceptions import EndSceneEarlyException
+            raise EndSceneEarlyException()
+
+    scene, segment.output = run_scene(job, options, config_file, seed, on_play)
+    segment.end_state = state_fingerprint(scene)
+    segment.wall_time = time.perf_counter() - start
+    return segment
+
+
+def check_boundaries(segments):
+    for previous, current in zip(segments, segments[1:]):
+        if previous.end_state != current.start_state:
+            raise NondeterministicSceneError(
+                f"Scene state differs at the boundary before animation {current.first} "
+                f"between segments {previous.index} and {current.index}. Skipped and "
+                f"rendered animations must leave the same state: make updaters "
+                f"independent of the frame rate and seed any randomness (--seed)."
+            )
+
+
+def concatenate_movies(movies, output):
+    os.makedirs(os.path.dirname(output), exist_ok=True)
+    list_path = output + ".segments.txt"
+    with open(list_path, "w") as file:
+        for movie in movies:
+            file.write(f"file '{movie}'\n")
+    subprocess.run(
+        ["ffmpeg", "-y", "-loglevel", "error", "-f", "concat", "-safe", "0",
+         "-i", list_path, "-c", "copy", output],
+        check=True,
+    )
+    os.remove(list_path)
+    return output
+
+
+def render_parallel(job, options, workers, config_file=None, seed=None,
+                    num_segments=None, output=None):
+    path = Path(job.path).resolve()
+    job = SceneJob(path, job.scene_name)
+    num_plays, state = plan_scene(job, options, config_file, seed)
+    if plan_scene(job, options, config_file, seed) != (num_plays, state):
+        raise NondeterministicSceneError(
+            f"Two passes over {job.scene_name} ended in different states. The scene "
+            f"uses unseeded randomness (e.g. random.uniform): pass --seed."
+        )
+    if num_plays == 0:
+        raise ValueError(f"{job.scene_name} has no animations to render")
+    segments = split_segments(num_plays, num_segments or workers)
+
+    media_root = path.parent / "media" / "parallel" / job.scene_name
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [
+            pool.submit(render_segment, job, options, config_file, seed, segment,
+                        str(media_root / f"segment_{segment.index:03}"))
+            for segment in segments
+        ]
+        segments = [future.result() for future in futures]
+
+    check_boundaries(segments)
+    output = output or str(media_root.with_suffix(".mp4"))
+    return concatenate_movies([segment.output for segment in segments], output), segments
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("module")
+    parser.add_argument("scene")
+    parser.add_argument("-q", "--quality", choices=QUALITIES, default="l")
+    parser.add_argument("-c", "--config_file")
+    parser.add_argument("-w", "--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--segments", type=int,
+                        help="number of timeline segments, one per worker by default")
+    parser.add_argument("--seed", type=int, help="seed for random, numpy.random and SceneRNG in every worker")
+    parser.add_argument("-o", "--output")
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    job = SceneJob(Path(args.module), args.scene)
+    options = get_config_options(args.quality)
+    config_file = os.path.abspath(args.config_file) if args.config_file else None
+    try:
+        output, segments = render_parallel(job, options, args.workers, config_file,
+                                           args.seed, args.segments, args.output)
+    except NondeterministicSceneError as error:
+        print(f"error: {error}")
+        return 1
+    for segment in segments:
+        print(f"segment {segment.index}: animations {segment.first}-{segment.last} "
+              f"in {segment.wall_time:.2f}s")
+    print(f"{output}\n{time.perf_counter() - start:.2f}s wall time")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
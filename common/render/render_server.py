@@ -0,0 +1,205 @@
+"""
+Warm render server: keeps manim imported in a long-lived process and
+renders scenes on request over a Unix socket, re-importing a scene
+module only when it (or one of the repo helpers it uses) changed.
+
+    python -m common.render.render_server serve
+    python -m common.render.render_server render source/animations/test_animation.py TestRotating -q p
+"""
+import argparse
+import copy
+import json
+import os
+import socket
+import socketserver
+import sys
+import tempfile
+import time
+from dataclasses import asdict
+from pathlib import Path
+
+from common.render.batch_render import (
+    QUALITIES,
+    ROOT,
+    SceneJob,
+    get_config_options,
+    load_module,
+    render_scene,
+)
+
+DEFAULT_SOCKET = os.path.join(tempfile.gettempdir(), "manim_render_server.sock")
+
+
+def _config_changes(before, after):
+    changes = {}
+    for key, value in after.items():
+        try:
+            same = key in before and bool(before[key] == value)
+        except (TypeError, ValueError):
+            same = key in before and before[key] is value
+        if not same:
+            changes[key] = copy.deepcopy(value)
+    return changes
+
+
+class ModuleCache:
+    """
+    Scene modules keyed by path, reloaded when their file changes. Repo
+    helper modules (e.g. common/) that changed on disk are dropped from
+    sys.modules first, and every scene module is then reloaded.
+
+    Module-level config lines (config.background_color = ...) only run
+    on import, inside the tempconfig of that render. The config changes
+    made by the import are recorded and applied again on every cache
+    hit, so a warm render sees the same config as a cold one.
+    """
+
+    def __init__(self):
+        self.modules = {}
+        self.helper_mtimes = {}
+        self.last_reloaded = False
+
+    def _stale_helpers(self):
+        stale = []
+        for name, module in list(sys.modules.items()):
+            path = getattr(module, "__file__", None)
+            if not path or name.startswith(("scenes.", "common.render", "__main__")):
+                continue
+            if not Path(path).resolve().is_relative_to(ROOT):
+                continue
+            mtime = os.path.getmtime(path) if os.path.exists(path) else None
+            if self.helper_mtimes.setdefault(name, mtime) != mtime:
+                stale.append(name)
+        return stale
+
+    def load(self, path):
+        from manim import config
+
+        path = Path(path).resolve()
+        stale = self._stale_helpers()
+        for name in stale:
+            del sys.modules[name]
+            del self.helper_mtimes[name]
+        if stale:
+            self.modules.clear()
+
+        mtime = os.path.getmtime(path)
+        cached = self.modules.get(path)
+        if cached is not None and cached[0] == mtime:
+            config._d.update(copy.deepcopy(cached[2]))
+            self.last_reloaded = False
+            return cached[1]
+        before = copy.deepcopy(config._d)
+        module = load_module(path)
+        self._stale_helpers()  # record the mtimes of newly imported helpers
+        self.modules[path] = (mtime, module, _config_changes(before, config._d))
+        self.last_reloaded = True
+        return module
+
+
+class RenderHandler(socketserver.StreamRequestHandler):
+    def handle(self):
+        try:
+            request = json.loads(self.rfile.readline())
+            response = self.server.render(request)
+        except Exception as error:
+            response = {"error": repr(error)}
+        self.wfile.write((json.dumps(response) + "\n").encode())
+
+
+class RenderServer(socketserver.UnixStreamServer):
+    """
+    Handles one render request at a time, since renders change the
+    working directory and the global manim config.
+
+    A request is one JSON line:
+        {"module": path, "scene": name, "quality": "l",
+         "disable_caching": false, "config_file": null}
+    and is answered by one JSON line with the output path, the
+    timings, whether the module was reloaded, and any error.
+    """
+
+    def __init__(self, socket_path=DEFAULT_SOCKET):
+        if os.path.exists(socket_path):
+            os.unlink(socket_path)
+        super().__init__(socket_path, RenderHandler)
+        self.socket_path = socket_path
+        self.modules = ModuleCache()
+
+    def render(self, request):
+        quality = request.get("quality", "l")
+        if quality not in QUALITIES:
+            raise ValueError(f"quality must be one of {list(QUALITIES)}")
+        job = SceneJob(Path(request["module"]).resolve(), request["scene"])
+        options = get_config_options(quality, request.get("disable_caching", False))
+        result = render_scene(job, options, request.get("config_file"), self.modules.load)
+        response = asdict(result)
+        response["path"] = str(result.path)
+        response["reloaded"] = self.modules.last_reloaded
+        return response
+
+    def server_close(self):
+        super().server_close()
+        if os.path.exists(self.socket_path):
+            os.unlink(self.socket_path)
+
+
+def serve(socket_path=DEFAULT_SOCKET):
+    start = time.perf_counter()
+    import manim  # noqa: F401  warm import, paid once per server
+    print(f"manim imported in {time.perf_counter() - start:.2f}s, listening on {socket_path}")
+    with RenderServer(socket_path) as server:
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+
+
+def request_render(module, scene, quality="l", disable_caching=False,
+                   config_file=None, socket_path=DEFAULT_SOCKET):
+    """Sends one render request to a running server and returns its answer."""
+    request = {
+        "module": os.path.abspath(module),
+        "scene": scene,
+        "quality": quality,
+        "disable_caching": disable_caching,
+        "config_file": os.path.abspath(config_file) if config_file else None,
+    }
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        client.connect(socket_path)
+        client.sendall((json.dumps(request) + "\n").encode())
+        with client.makefile("rb") as response:
+            return json.loads(response.readline())
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--socket", default=DEFAULT_SOCKET)
+    commands = parser.add_subparsers(dest="command", required=True)
+    commands.add_parser("serve")
+    render = commands.add_parser("render")
+    render.add_argument("module")
+    render.add_argument("scene")
+    render.add_argument("-q", "--quality", choices=QUALITIES, default="l")
+    render.add_argument("-c", "--config_file")
+    render.add_argument("--disable_caching", action="store_true")
+    args = parser.parse_args(argv)
+
+    if args.command == "serve":
+        serve(args.socket)
+        return 0
+
+    response = request_render(args.module, args.scene, args.quality,
+                              args.disable_caching, args.config_file, args.socket)
+    if response.get("error"):
+        print(response["error"])
+        return 1
+    print(f"{response['output']}\n"
+          f"load {response['load_time']:.2f}s, total {response['wall_time']:.2f}s"
+          f"{' (module reloaded)' if response['reloaded'] else ''}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,169 @@
+"""
+Scene-level fingerprints for batch renders: a hash of the scene's own
+source, the repo helpers it imports, the assets it references and the
+render config. A manifest maps each scene to the fingerprint and output
+of its last successful render, so unchanged scenes can be skipped.
+"""
+import ast
+import hashlib
+import json
+import time
+from pathlib import Path
+
+from common.render.notebook_source import read_source
+
+ROOT = Path(__file__).resolve().parents[2]
+
+# read only by the `if __name__ == "__main__":` launchers
+LAUNCHER_CONSTANTS = {"SCENE_NAME", "DISABLE_CACHE"}
+
+ASSET_EXTENSIONS = ("", ".svg", ".png", ".jpg", ".jpeg", ".mp3", ".wav", ".csv", ".tex", ".cfg", ".cpp")
+
+
+def _module_path(module_name, directory):
+    """Repo file of an imported module: common.* from the root, siblings from the module's folder."""
+    relative = Path(*module_name.split("."))
+    for base in (ROOT, directory):
+        for candidate in (base / relative.with_suffix(".py"), base / relative / "__init__.py"):
+            if candidate.exists():
+                return candidate.resolve()
+    return None
+
+
+def _is_main_guard(node):
+    return (isinstance(node, ast.If)
+            and isinstance(node.test, ast.Compare)
+            and getattr(node.test.left, "id", None) == "__name__")
+
+
+def _is_launcher_constant(node):
+    return (isinstance(node, ast.Assign)
+            and all(getattr(target, "id", None) in LAUNCHER_CONSTANTS for target in node.targets))
+
+
+def _walk_without_main_guard(tree):
+    pending = [tree]
+    while pending:
+        node = pending.pop()
+        yield node
+        pending.extend(child for child in ast.iter_child_nodes(node)
+                       if not _is_main_guard(child))
+
+
+def imported_helpers(path, seen=None):
+    """
+    Repo modules imported by a module, followed transitively. Imports
+    under `if __name__ == "__main__":` (launchers, benchmarks) are ignored.
+    """
+    path = Path(path).resolve()
+    seen = set() if seen is None else seen
+    tree = ast.parse(read_source(path))
+    for node in _walk_without_main_guard(tree):
+        if isinstance(node, ast.Import):
+            names = [alias.name for alias in node.names]
+        elif isinstance(node, ast.ImportFrom) and node.module and not node.level:
+            names = [node.module]
+        else:
+            continue
+        for name in names:
+            helper = _module_path(name, path.parent)
+            if helper is not None and helper != path and helper not in seen:
+                seen.add(helper)
+                imported_helpers(helper, seen)
+    return seen
+
+
+def scene_source(path, scene_name):
+    """
+    Source of the scene class, the in-module classes it derives from,
+    and every top-level statement that is not a class definition, the
+    launcher or one of its constants. Editing another scene of the same
+    file, or SCENE_NAME to preview another scene, does not change it.
+    """
+    source = read_source(path)
+    tree = ast.parse(source)
+    classes = {node.name: node for node in tree.body if isinstance(node, ast.ClassDef)}
+    wanted = []
+    pending = [scene_name]
+    while pending:
+        node = classes.get(pending.pop())
+        if node is None or node in wanted:
+            continue
+        wanted.append(node)
+        pending.extend(getattr(base, "id", "") for base in node.bases)
+    parts = [ast.get_source_segment(source, node) for node in tree.body
+             if node in wanted or not (isinstance(node, ast.ClassDef)
+                                       or _is_main_guard(node)
+                                       or _is_launcher_constant(node))]
+    return "\n".join(part or "" for part in parts)
+
+
+def referenced_assets(path):
+    """Files next to the module, or in its assets folder, named by a string literal."""
+    path = Path(path).resolve()
+    tree = ast.parse(read_source(path))
+    assets = set()
+    for node in ast.walk(tree):
+        if not isinstance(node, ast.Constant) or not isinstance(node.value, str):
+            continue
+        name = node.value
+        if not name or len(name) > 255 or "\n" in name:
+            continue
+        for base in (path.parent, path.parent / "assets"):
+            for extension in ASSET_EXTENSIONS:
+                candidate = base / (name + extension)
+                if candidate.is_file() and candidate != path:
+                    assets.add(candidate.resolve())
+    return assets
+
+
+def _file_digest(path):
+    return hashlib.sha256(Path(path).read_bytes()).hexdigest()
+
+
+def scene_fingerprint(job, options, config_file=None):
+    path = Path(job.path).resolve()
+    digest = hashlib.sha256()
+    digest.update(scene_source(path, job.scene_name).encode())
+    files = set(imported_helpers(path)) | referenced_assets(path)
+    for config_path in (config_file, path.parent / "manim.cfg"):
+        if config_path and Path(config_path).exists():
+            files.add(Path(config_path).resolve())
+    for file in sorted(files):
+        digest.update(f"{file.relative_to(ROOT) if file.is_relative_to(ROOT) else file}".encode())
+        digest.update(_file_digest(file).encode())
+    digest.update(json.dumps(options, sort_keys=True, default=str).encode())
+    return digest.hexdigest()
+
+
+def job_key(job):
+    return f"{Path(job.path).resolve().relative_to(ROOT).as_posix()}::{job.scene_name}"
+
+
+class RenderManifest:
+    """JSON record of the fingerprint and output of each scene's last successful render."""
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self.entries = json.loads(self.path.read_text()) if self.path.exists() else {}
+
+    def is_fresh(self, job, fingerprint):
+        entry = self.entries.get(job_key(job))
+        return (entry is not None
+                and entry["fingerprint"] == fingerprint
+                and entry.get("output") is not None
+                and Path(entry["output"]).exists())
+
+    def get_output(self, job):
+        return self.entries[job_key(job)].get("output")
+
+    def record(self, job, fingerprint, output):
+        self.entries[job_key(job)] = {
+            "fingerprint": fingerprint,
+            "output": output,
+            "rendered_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        }
+
+    def save(self):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.path.write_text(json.dumps(self.entries, indent=2, sort_keys=True))
@@ -1,27 +1,114 @@
-from manim import interpolate_color
+from itertools import cycle, islice
+
+import numpy as np
+from manim import color_to_rgb, rgb_to_color
+
+
+class ColorGradient:
+    """
+    Multi-stop color gradient compiled once to an RGB array, mapping
+    whole arrays of alphas to colors in one call.
+
+    colors: list of colors
+        the color stops
+    positions: list of floats, optional
+        increasing stop positions in [0, 1], evenly spaced by default
+    """
+
+    def __init__(self, colors, positions=None):
+        self.rgbs = np.array([color_to_rgb(c) for c in colors])
+        if positions is None:
+            positions = np.linspace(0, 1, len(colors))
+        self.positions = np.asarray(positions, dtype=float)
+        if len(self.positions) != len(self.rgbs):
+            raise ValueError("positions and colors must have the same length")
+        if np.any(np.diff(self.positions) < 0):
+            raise ValueError("positions must be increasing")
+
+    def rgbs_at(self, alphas):
+        """RGB array of shape alphas.shape + (3,), alphas are clipped to the stops."""
+        alphas = np.asarray(alphas, dtype=float)
+        return np.stack([
+            np.interp(alphas, self.positions, self.rgbs[:, i])
+            for i in range(3)
+        ], axis=-1)
+
+    def colors_at(self, alphas):
+        return [rgb_to_color(rgb) for rgb in self.rgbs_at(np.ravel(alphas))]
+
+    def color_at(self, alpha):
+        return rgb_to_color(self.rgbs_at(alpha))
 
 
 def interpolate_color_range(*colors):
     alpha = colors[-1]
     colors = colors[:-1]
-    partition = len(colors)
-    dx = 1 / (partition - 1)
-
-    colors_steps = [
-        (colors[i], colors[i + 1])
-        for i in range(partition - 1)
-    ]
-
-    alpha_steps = [
-        (dx * i, dx * (i + 1))
-        for i in range(partition - 1)
-    ]
-
-    i_count = 0
-
-    for c_s, a_s in zip(colors_steps, alpha_steps):
-        if a_s[0] <= alpha <= a_s[1]:
-            d_alpha = alpha - dx * i_count
-            c_alpha = d_alpha / dx
-            return interpolate_color(c_s[0], c_s[1], c_alpha)
-        i_count += 1
+    return ColorGradient(colors).color_at(alpha)
+
+
+def _as_rgbs(colors, n):
+    rgbs = np.asarray(colors) if isinstance(colors, np.ndarray) else \
+        np.array([color_to_rgb(c) for c in colors])
+    if rgbs.shape != (n, 3):
+        raise ValueError(f"expected {n} colors, got an array of shape {rgbs.shape}")
+    return rgbs
+
+
+def apply_rgbs(mobjects, rgbs, opacities=None, fill=True, stroke=True):
+    """
+    Writes one color per member of a VGroup straight into the fill and
+    stroke rgba arrays of its family, bypassing set_color style resolution.
+
+    mobjects: VGroup or list of VMobjects
+    rgbs: (n, 3) array or list of n colors
+    opacities: float or (n,) array, optional
+        new opacities, the current ones are kept by default
+    """
+    mobjects = list(mobjects)
+    rgbs = _as_rgbs(rgbs, len(mobjects))
+    if opacities is not None:
+        opacities = np.broadcast_to(np.asarray(opacities, dtype=float), (len(mobjects),))
+
+    for index, (member, rgb) in enumerate(zip(mobjects, rgbs)):
+        for mob in member.family_members_with_points():
+            if fill:
+                alpha = mob.fill_rgbas[0, 3] if opacities is None else opacities[index]
+                mob.fill_rgbas = np.array([[*rgb, alpha]])
+            if stroke:
+                alpha = mob.stroke_rgbas[0, 3] if opacities is None else opacities[index]
+                mob.stroke_rgbas = np.array([[*rgb, alpha]])
+        member.color = rgb_to_color(rgb)
+    return mobjects
+
+
+def color_by_gradient(mobjects, colors, alphas=None, positions=None, **kwargs):
+    """Colors the members along a ColorGradient, evenly spread by default."""
+    mobjects = list(mobjects)
+    if alphas is None:
+        alphas = np.linspace(0, 1, len(mobjects))
+    rgbs = ColorGradient(colors, positions).rgbs_at(alphas)
+    return apply_rgbs(mobjects, rgbs, **kwargs)
+
+
+def palette_rgbs(palette, labels):
+    """RGB array with row i set to palette[labels[i]]."""
+    rgbs = np.array([color_to_rgb(c) for c in palette])
+    return rgbs[np.asarray(labels, dtype=int)]
+
+
+def mask_rgbs(mask, true_color, false_color):
+    """RGB array with true_color where mask is set and false_color elsewhere."""
+    return palette_rgbs([false_color, true_color], np.asarray(mask, dtype=bool))
+
+
+def color_by_palette(mobjects, palette, labels=None, **kwargs):
+    """Colors member i with palette[labels[i]], cycling through the palette by default."""
+    mobjects = list(mobjects)
+    if labels is None:
+        labels = list(islice(cycle(range(len(palette))), len(mobjects)))
+    return apply_rgbs(mobjects, palette_rgbs(palette, labels), **kwargs)
+
+
+def color_by_mask(mobjects, mask, true_color, false_color, **kwargs):
+    """Two-color categorical coloring from a boolean mask, e.g. a containment test."""
+    return apply_rgbs(mobjects, mask_rgbs(mask, true_color, false_color), **kwargs)
@@ -0,0 +1,127 @@
+import hashlib
+
+import numpy as np
+
+SAMPLING_MODES = ("arclength", "parameter")
+
+
+def points_digest(points):
+    return hashlib.sha1(np.ascontiguousarray(points).tobytes()).hexdigest()
+
+
+def cubic_bernstein(t):
+    t = np.asarray(t, dtype=float)[..., np.newaxis]
+    return np.concatenate([
+        (1 - t) ** 3,
+        3 * (1 - t) ** 2 * t,
+        3 * (1 - t) * t ** 2,
+        t ** 3,
+    ], axis=-1)
+
+
+def get_curves(vmob):
+    """The cubic curves of a VMobject's own points, shape (k, 4, 3)."""
+    points = vmob.points
+    if len(points) < 4:
+        raise ValueError(f"{type(vmob).__name__} has no curves to sample")
+    return points[:len(points) - len(points) % 4].reshape(-1, 4, 3)
+
+
+def curve_points(vmob, t_values):
+    """Every curve evaluated at every t, shape (k * len(t_values), 3), curve by curve."""
+    return np.einsum("sj,kjd->ksd", cubic_bernstein(t_values), get_curves(vmob)).reshape(-1, 3)
+
+
+class ArcLengthTable:
+    """
+    Cumulative arc length along the curves of a VMobject, measured on
+    samples_per_curve chords per curve. Proportions of the total length
+    map to curve parameters by binary search in the table.
+
+    The global curve parameter u runs from 0 to the number of curves:
+    curve floor(u) at local t = u - floor(u).
+    """
+
+    def __init__(self, vmob, samples_per_curve=16):
+        self.curves = get_curves(vmob).copy()
+        self.num_curves = len(self.curves)
+        self.samples_per_curve = samples_per_curve
+        t = np.linspace(0, 1, samples_per_curve + 1)
+        samples = np.einsum("sj,kjd->ksd", cubic_bernstein(t), self.curves)
+        chords = np.linalg.norm(np.diff(samples, axis=1), axis=2).ravel()
+        self.lengths = np.concatenate([[0], np.cumsum(chords)])
+        self.parameters = np.arange(len(self.lengths)) / samples_per_curve
+        self.total_length = self.lengths[-1]
+
+    def parameters_at(self, alphas):
+        """Global curve parameters at the given proportions of the arc length."""
+        alphas = np.clip(np.asarray(alphas, dtype=float), 0, 1)
+        return np.interp(alphas * self.total_length, self.lengths, self.parameters)
+
+    def proportions_at(self, parameters):
+        """Inverse of parameters_at: proportions of the arc length at global curve parameters."""
+        lengths = np.interp(parameters, self.parameters, self.lengths)
+        return lengths / self.total_length if self.total_length else np.zeros_like(lengths)
+
+    def points_at_parameters(self, parameters):
+        parameters = np.clip(np.asarray(parameters, dtype=float), 0, self.num_curves)
+        indexes = np.minimum(np.floor(parameters).astype(int), self.num_curves - 1)
+        t = parameters - indexes
+        return np.einsum("...j,...jd->...d", cubic_bernstein(t), self.curves[indexes])
+
+    def points_at(self, alphas, mode="arclength"):
+        """
+        Points at the given proportions, spread uniformly by arc length
+        along the whole path or by curve parameter.
+        """
+        if mode not in SAMPLING_MODES:
+            raise ValueError(f"mode must be one of {SAMPLING_MODES}, got {mode!r}")
+        if mode == "parameter":
+            parameters = np.clip(np.asarray(alphas, dtype=float), 0, 1) * self.num_curves
+        else:
+            parameters = self.parameters_at(alphas)
+        return self.points_at_parameters(parameters)
+
+
+def get_arc_length_table(vmob, samples_per_curve=16):
+    """
+    Returns the ArcLengthTable of a VMobject, cached on it and rebuilt
+    only when its points change.
+    """
+    digest = points_digest(vmob.points)
+    cache = vmob.__dict__.setdefault("_arc_length_cache", {})
+    cached = cache.get(samples_per_curve)
+    if cached is not None and cached[0] == digest:
+        return cached[1]
+    table = ArcLengthTable(vmob, samples_per_curve)
+    cache[samples_per_curve] = (digest, table)
+    return table
+
+
+def get_subcurve_by_arc_length(vmob, a, b, samples_per_curve=16):
+    """
+    Part of a VMobject between proportions a and b of its arc length.
+    VMobject.get_subcurve splits by curve count instead, so its pieces
+    are uneven when the curves have different lengths.
+    """
+    table = get_arc_length_table(vmob, samples_per_curve)
+    start, end = table.parameters_at([a, b]) / table.num_curves
+    subcurve = vmob.copy()
+    subcurve.pointwise_become_partial(vmob, start, end)
+    return subcurve
+
+
+def sample_points(vmob, alphas, mode="arclength", samples_per_curve=16):
+    """
+    Batched alternative to point_from_proportion: an (n, 3) array of
+    points at the proportions in alphas.
+
+    mode: "arclength" or "parameter"
+        spread uniformly by arc length, or by curve parameter
+
+    point_from_proportion is only uniform by arc length across curves,
+    within a curve it is linear in t. "arclength" is uniform inside
+    each curve too, so the points can differ from it (by up to ~0.17
+    on the CheckInside curve), which moves the CheckInside border samples.
+    """
+    return get_arc_length_table(vmob, samples_per_curve).points_at(alphas, mode)
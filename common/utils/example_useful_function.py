@@ -95,6 +95,10 @@ point = line.point_from_proportion(0.5)
 # Get a part of a line
 part_line = line.get_subcurve(0.3, 0.6)
 
+# Get a part of a line, measured by arc length (cached table lookup)
+from common.utils.curve_utils import get_subcurve_by_arc_length
+part_line_by_length = get_subcurve_by_arc_length(line, 0.3, 0.6)
+
 # Save state and restore state of object
 square = Square().save_state()
 Restore(square)  # self.play(Restore(square))
@@ -103,6 +107,10 @@ Restore(square)  # self.play(Restore(square))
 # Move a point along the path
 MoveAlongPath(Dot(), part_line)  # self.play(MoveAlongPath(Dot(), part_line))
 
+# Same, but every frame is a lookup in the path's cached arc-length table
+from common.custom.custom_animation import MoveAlongArcLength
+MoveAlongArcLength(Dot(), part_line)  # self.play(MoveAlongArcLength(Dot(), part_line))
+
 # Create a rectangle surround an object
 Rectangle().surround(square)
 
@@ -0,0 +1,174 @@
+import os
+from pathlib import Path
+
+import numpy as np
+from manim import VGroup, VMobject
+
+
+def serialize_family(mob):
+    """
+    Flattens a VMobject hierarchy (pre-order) into plain arrays:
+    parent indexes, concatenated points, fill/stroke rgbas and stroke widths.
+    """
+    nodes = []
+    parents = []
+
+    def visit(node, parent):
+        index = len(nodes)
+        nodes.append(node)
+        parents.append(parent)
+        for submob in node.submobjects:
+            visit(submob, index)
+
+    visit(mob, -1)
+
+    def concat(arrays, width):
+        offsets = np.cumsum([0] + [len(a) for a in arrays])
+        data = np.concatenate(arrays) if offsets[-1] else np.zeros((0, width))
+        return data, offsets
+
+    points, point_offsets = concat([n.points for n in nodes], 3)
+    fill, fill_offsets = concat([n.fill_rgbas for n in nodes], 4)
+    stroke, stroke_offsets = concat([n.stroke_rgbas for n in nodes], 4)
+    return points, {
+        "parents": np.array(parents),
+        "point_offsets": point_offsets,
+        "fill_rgbas": fill,
+        "fill_offsets": fill_offsets,
+        "stroke_rgbas": stroke,
+        "stroke_offsets": stroke_offsets,
+        "stroke_widths": np.array([n.stroke_width for n in nodes], dtype=float),
+    }
+
+
+def deserialize_family(points, meta):
+    """Rebuilds the hierarchy saved by serialize_family as VMobjects and VGroups."""
+    parents = meta["parents"]
+    point_offsets = meta["point_offsets"]
+    fill_offsets = meta["fill_offsets"]
+    stroke_offsets = meta["stroke_offsets"]
+    has_children = np.zeros(len(parents), dtype=bool)
+    has_children[parents[parents >= 0]] = True
+
+    nodes = []
+    for i, parent in enumerate(parents):
+        a, b = point_offsets[i], point_offsets[i + 1]
+        node = VGroup() if a == b and has_children[i] else VMobject()
+        node.points = np.array(points[a:b])
+        node.fill_rgbas = np.array(meta["fill_rgbas"][fill_offsets[i]:fill_offsets[i + 1]])
+        node.stroke_rgbas = np.array(meta["stroke_rgbas"][stroke_offsets[i]:stroke_offsets[i + 1]])
+        node.stroke_width = meta["stroke_widths"][i]
+        nodes.append(node)
+        if parent >= 0:
+            nodes[parent].add(node)
+    return nodes[0]
+
+
+def _write_atomic(path, write):
+    # Writes next to path and renames it into place, so that other
+    # processes never load a partially written file.
+    temporary = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        with open(temporary, "wb") as file:
+            write(file)
+        os.replace(temporary, path)
+    finally:
+        if temporary.exists():
+            temporary.unlink()
+
+
+class GeometryStore:
+    """
+    On-disk store of serialized mobject geometry with size-bounded LRU
+    eviction. Each entry is a memory-mappable .npy of all points plus a
+    .npz of the family structure and styles. Text entries (load_text,
+    save_text) share the same accounting and eviction.
+
+    directory: str or Path
+        where entries are written
+    max_bytes: int
+        total size above which the least recently used entries are evicted
+    """
+
+    def __init__(self, directory, max_bytes=256 * 1024 ** 2):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+
+    def _paths(self, key):
+        return self.directory / f"{key}.points.npy", self.directory / f"{key}.meta.npz"
+
+    def load(self, key):
+        points_path, meta_path = self._paths(key)
+        if not (points_path.exists() and meta_path.exists()):
+            self.misses += 1
+            return None
+        self.hits += 1
+        for path in (points_path, meta_path):
+            os.utime(path)
+        points = np.load(points_path, mmap_mode="r")
+        with np.load(meta_path) as meta:
+            return deserialize_family(points, dict(meta))
+
+    def save(self, key, mob):
+        points_path, meta_path = self._paths(key)
+        points, meta = serialize_family(mob)
+        # The metadata goes last, since load only trusts entries that have it.
+        _write_atomic(points_path, lambda file: np.save(file, points))
+        _write_atomic(meta_path, lambda file: np.savez(file, **meta))
+        self.evict()
+
+    def load_text(self, key, extension="txt"):
+        path = self.directory / f"{key}.{extension}"
+        if not path.exists():
+            self.misses += 1
+            return None
+        self.hits += 1
+        os.utime(path)
+        return path.read_text(encoding="utf-8")
+
+    def save_text(self, key, text, extension="txt"):
+        _write_atomic(self.directory / f"{key}.{extension}",
+                      lambda file: file.write(text.encode("utf-8")))
+        self.evict()
+
+    def get_or_create(self, key, factory):
+        mob = self.load(key)
+        if mob is None:
+            mob = factory()
+            self.save(key, mob)
+        return mob
+
+    def entries(self):
+        """(last_used, size, [paths]) per entry, least recently used first."""
+        files = {}
+        for path in self.directory.iterdir():
+            if path.is_file() and not path.name.endswith(".tmp"):
+                files.setdefault(path.name.split(".", 1)[0], []).append(path)
+        entries = []
+        for paths in files.values():
+            stats = [path.stat() for path in paths]
+            entries.append((max(stat.st_mtime for stat in stats),
+                            sum(stat.st_size for stat in stats), paths))
+        return sorted(entries, key=lambda entry: entry[0])
+
+    def size(self):
+        return sum(size for _, size, _ in self.entries())
+
+    def evict(self):
+        entries = self.entries()
+        total = sum(size for _, size, _ in entries)
+        for _, size, paths in entries:
+            if total <= self.max_bytes:
+                break
+            for path in paths:
+                path.unlink()
+            total -= size
+
+    def report(self):
+        entries = self.entries()
+        size = sum(size for _, size, _ in entries)
+        return (f"{self.directory}: {self.hits} hits, {self.misses} misses, "
+                f"{len(entries)} entries, {size / 1024 ** 2:.1f} MB")
@@ -1,13 +1,60 @@
 from manim import *
+from common.utils.color_utils import color_by_palette
 
-def get_indexes(mob, font_size=15, color_tex=True):
+INDEX_COLORS = [RED, TEAL, GREEN, BLUE, PURPLE]
+
+
+class DigitGlyphCache:
+    """
+    Digit glyphs rendered once per (font, font_size, color) key.
+    Numeric labels are composed from copies of the cached glyphs, so
+    repeated labels never go back through the text renderer.
+    """
+    CHARACTERS = "0123456789.-"
+
+    def __init__(self):
+        self.glyphs = {}
+
+    def get_glyphs(self, font, font_size, color):
+        key = (font, font_size, str(color))
+        if key not in self.glyphs:
+            reference = Text(self.CHARACTERS, font=font, font_size=font_size, color=color)
+            digits = reference[:10]
+            spacing = np.mean([
+                right.get_left()[0] - left.get_right()[0]
+                for left, right in zip(digits[:-1], digits[1:])
+            ])
+            self.glyphs[key] = (dict(zip(self.CHARACTERS, reference)), spacing)
+        return self.glyphs[key]
+
+    def get_label(self, number, font="Times", font_size=15, color=WHITE):
+        glyphs, spacing = self.get_glyphs(font, font_size, color)
+        label = VGroup()
+        x = 0
+        for char in str(number):
+            if char not in glyphs:
+                raise ValueError(f"No cached glyph for {char!r} in {number!r}")
+            glyph = glyphs[char].copy()
+            glyph.shift((x - glyph.get_left()[0]) * RIGHT)
+            x = glyph.get_right()[0] + spacing
+            label.add(glyph)
+        return label
+
+
+GLYPH_CACHE = DigitGlyphCache()
+
+
+def get_number_label(number, font="Times", font_size=15, color=WHITE):
+    return GLYPH_CACHE.get_label(number, font=font, font_size=font_size, color=color)
+
+
+def get_indexes(mob, font_size=15, color_tex=True, colors=INDEX_COLORS, font="Times"):
     from itertools import cycle
     ni = VGroup()
-    colors = cycle([RED, TEAL, GREEN, BLUE, PURPLE])
+    palette = cycle(colors)
     for i in range(len(mob)):
-        c = next(colors)
-        n = Text(f"{i}",  font_size=font_size, font="Times", color=c)
+        n = get_number_label(i, font=font, font_size=font_size, color=next(palette))
         n.next_to(mob[i], DOWN, buff=0.05)
         ni.add(n)
-        if color_tex: mob[i].set_color(c)
+    if color_tex: color_by_palette(mob, colors)
     return ni
\ No newline at end of file
@@ -0,0 +1,106 @@
+"""
+Seeded random numbers for scenes. Every scene draws from one
+numpy Generator, so a render is reproducible from its seed, and
+independent child streams can be split off for workers or for
+separate parts of a scene.
+
+The seed comes from the argument, or else from the MANIM_SCENE_SEED
+environment variable (set by common.render.parallel_render --seed).
+get_scene_rng then falls back to DEFAULT_SCENE_SEED, so scenes render
+the same every time; a bare SceneRNG falls back to fresh OS entropy.
+
+Batched draws consume the stream point by point, so drawing n points
+at once or in several smaller batches gives the same points.
+"""
+import os
+
+import numpy as np
+
+from common.utils.containment_utils import flatten_subpaths, points_in_polygons
+
+SEED_ENVIRONMENT_VARIABLE = "MANIM_SCENE_SEED"
+DEFAULT_SCENE_SEED = 0
+
+
+def get_default_seed():
+    seed = os.environ.get(SEED_ENVIRONMENT_VARIABLE)
+    return int(seed) if seed else None
+
+
+class SceneRNG:
+    """
+    seed: int, np.random.SeedSequence or None
+        None reads MANIM_SCENE_SEED, and falls back to OS entropy
+    """
+
+    def __init__(self, seed=None):
+        if seed is None:
+            seed = get_default_seed()
+        if not isinstance(seed, np.random.SeedSequence):
+            seed = np.random.SeedSequence(seed)
+        self.seed_sequence = seed
+        self.seed = seed.entropy
+        self.generator = np.random.default_rng(seed)
+
+    def uniform(self, low=0.0, high=1.0, size=None):
+        return self.generator.uniform(low, high, size)
+
+    def uniform_in_box(self, n, x_range, y_range, z=0):
+        """An (n, 3) array of points drawn uniformly in a box of the xy plane."""
+        low = np.array([x_range[0], y_range[0]], dtype=float)
+        high = np.array([x_range[1], y_range[1]], dtype=float)
+        points = np.full((n, 3), float(z))
+        points[:, :2] = low + self.generator.random((n, 2)) * (high - low)
+        return points
+
+    def uniform_in_shape(self, n, vmob, fill_rule="evenodd", samples_per_curve=8,
+                         max_empty_batches=20):
+        """
+        An (n, 3) array of points drawn uniformly inside a VMobject, by
+        rejection sampling batches in its bounding box. Raises ValueError
+        when max_empty_batches batches in a row land outside the shape,
+        e.g. for an outline enclosing no area.
+        """
+        polygons = flatten_subpaths(vmob, samples_per_curve)
+        if not polygons:
+            raise ValueError(f"{type(vmob).__name__} has no outline to sample in")
+        corners = np.vstack(polygons)
+        x_range = corners[:, 0].min(), corners[:, 0].max()
+        y_range = corners[:, 1].min(), corners[:, 1].max()
+        z = vmob.get_center()[2]
+
+        accepted = []
+        count = 0
+        acceptance = 0.5
+        empty_batches = 0
+        while count < n:
+            batch = int((n - count) / acceptance * 1.1) + 16
+            candidates = self.uniform_in_box(batch, x_range, y_range, z)
+            inside = candidates[points_in_polygons(candidates, polygons, fill_rule)]
+            acceptance = max(len(inside) / batch, 0.01)
+            empty_batches = 0 if len(inside) else empty_batches + 1
+            if empty_batches >= max_empty_batches:
+                raise ValueError(f"{type(vmob).__name__} encloses no area to sample in")
+            accepted.append(inside)
+            count += len(inside)
+        return np.vstack(accepted)[:n]
+
+    def spawn(self, n):
+        """n independent child SceneRNGs, the same ones for the same seed."""
+        return [SceneRNG(child) for child in self.seed_sequence.spawn(n)]
+
+
+def get_scene_rng(scene, seed=None):
+    """
+    The SceneRNG of a scene, created on first use. Later calls return
+    the same generator, so a scene draws one reproducible sequence.
+    The seed defaults to MANIM_SCENE_SEED, then DEFAULT_SCENE_SEED.
+    """
+    rng = scene.__dict__.get("_scene_rng")
+    if rng is None:
+        if seed is None:
+            seed = get_default_seed()
+        if seed is None:
+            seed = DEFAULT_SCENE_SEED
+        rng = scene.__dict__["_scene_rng"] = SceneRNG(seed)
+    return rng
@@ -0,0 +1,64 @@
+import numpy as np
+from scipy.spatial import cKDTree
+
+from common.utils.curve_utils import points_digest, sample_points
+
+
+class BorderIndex:
+    """
+    KD-tree over the border samples of a mobject, answering
+    nearest-sample queries for many points at once.
+
+    samples: array-like, shape (m, 3)
+        border samples, e.g. VMobject.points or point_from_proportion values
+    """
+
+    def __init__(self, samples):
+        self.samples = np.asarray(samples, dtype=float)
+        self.tree = cKDTree(self.samples[:, :2])
+
+    def __len__(self):
+        return len(self.samples)
+
+    def nearest(self, points):
+        """Index of the closest sample for every query point."""
+        points = np.atleast_2d(np.asarray(points, dtype=float))
+        _, indexes = self.tree.query(points[:, :2])
+        return indexes
+
+    def nearest_distance(self, points):
+        """Distance to, and index of, the closest sample for every query point."""
+        points = np.atleast_2d(np.asarray(points, dtype=float))
+        return self.tree.query(points[:, :2])
+
+    def k_nearest(self, points, k):
+        """Indexes of the k closest samples, shape (n, k), nearest first."""
+        points = np.atleast_2d(np.asarray(points, dtype=float))
+        _, indexes = self.tree.query(points[:, :2], k=k)
+        return indexes.reshape(len(points), k)
+
+
+def get_border_samples(mob, num_samples=None):
+    """
+    Border samples of a mobject: its raw points when num_samples is
+    None, else num_samples points evenly spread by arc length.
+    """
+    if num_samples is None:
+        return mob.get_all_points()
+    return sample_points(mob, np.arange(num_samples) / num_samples)
+
+
+def get_border_index(mob, num_samples=None):
+    """
+    Returns the BorderIndex of a mobject, building it on first use.
+    The index is cached on the mobject and only rebuilt when its
+    points change.
+    """
+    digest = points_digest(mob.get_all_points())
+    cache = mob.__dict__.setdefault("_border_index_cache", {})
+    cached = cache.get(num_samples)
+    if cached is not None and cached[0] == digest:
+        return cached[1]
+    index = BorderIndex(get_border_samples(mob, num_samples))
+    cache[num_samples] = (digest, index)
+    return index
@@ -0,0 +1,45 @@
+import hashlib
+import json
+import os
+
+from manim import SVGMobject, config
+from manim.utils.images import get_full_vector_image_path
+
+from common.utils.geometry_cache import GeometryStore
+
+_SVG_STORE = None
+_LOADED_SVGS = {}
+
+
+def get_svg_store(max_bytes=256 * 1024 ** 2):
+    """Project-level store of parsed SVG geometry, under the media directory."""
+    global _SVG_STORE
+    if _SVG_STORE is None:
+        _SVG_STORE = GeometryStore(os.path.join(config.media_dir, "svg_geometry"), max_bytes)
+    return _SVG_STORE
+
+
+def svg_cache_key(file_path, kwargs):
+    """Hash of the SVG file content and the load options."""
+    with open(file_path, "rb") as file:
+        content_hash = hashlib.sha256(file.read()).hexdigest()
+    payload = json.dumps([content_hash, sorted(kwargs.items())], default=str)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def cached_svg_mobject(file_name, **kwargs):
+    """
+    SVGMobject geometry served from a binary cache keyed by the file
+    content and the load options. The first load parses the XML and
+    saves the submobject points and styles; later loads read them
+    back from a memory-mapped array, and repeated loads in the same
+    session are plain copies.
+    The result is a VGroup with the same submobject structure as the
+    SVGMobject, so shape[0] and friends keep working.
+    """
+    key = svg_cache_key(get_full_vector_image_path(file_name), kwargs)
+    if key not in _LOADED_SVGS:
+        _LOADED_SVGS[key] = get_svg_store().get_or_create(
+            key, lambda: SVGMobject(file_name, **kwargs)
+        )
+    return _LOADED_SVGS[key].copy()
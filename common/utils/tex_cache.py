@@ -0,0 +1,55 @@
+import hashlib
+import json
+import os
+
+from manim import MathTex, Tex, config
+
+from common.utils.geometry_cache import GeometryStore
+
+_TEX_STORE = None
+
+
+def get_tex_store(max_bytes=256 * 1024 ** 2):
+    """Project-level store of compiled tex fragments, under the media directory."""
+    global _TEX_STORE
+    if _TEX_STORE is None:
+        _TEX_STORE = GeometryStore(os.path.join(config.media_dir, "tex_fragments"), max_bytes)
+    return _TEX_STORE
+
+
+def tex_fragment_key(tex_class, tex_strings, tex_template, kwargs):
+    """Hash of the template preamble, the tex strings and the build options."""
+    template_hash = hashlib.sha256(
+        f"{tex_template.tex_compiler}\n{tex_template.body}".encode()
+    ).hexdigest()
+    payload = json.dumps(
+        [tex_class.__name__, template_hash, list(tex_strings), sorted(kwargs.items())],
+        default=str,
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def _cached_tex_mobject(tex_class, tex_strings, tex_template, kwargs):
+    tex_template = tex_template or config["tex_template"]
+    key = tex_fragment_key(tex_class, tex_strings, tex_template, kwargs)
+    return get_tex_store().get_or_create(
+        key, lambda: tex_class(*tex_strings, tex_template=tex_template, **kwargs)
+    )
+
+
+def cached_math_tex(*tex_strings, tex_template=None, **kwargs):
+    """
+    MathTex geometry served from the on-disk fragment store. A rerun
+    skips both the LaTeX compilation and the SVG parsing.
+    The result is a VGroup with the same submobject structure as the
+    MathTex, so indexing such as formula[3] keeps working. It is not a
+    MathTex: tex_string, get_part_by_tex, set_color_by_tex and the other
+    tex-specific attributes are gone, and empty groups come back as
+    VMobjects.
+    """
+    return _cached_tex_mobject(MathTex, tex_strings, tex_template, kwargs)
+
+
+def cached_tex(*tex_strings, tex_template=None, **kwargs):
+    """Tex counterpart of cached_math_tex."""
+    return _cached_tex_mobject(Tex, tex_strings, tex_template, kwargs)
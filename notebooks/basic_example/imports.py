@@ -3,8 +3,19 @@ from manim_lexer import ManimLexer
 from pygments import highlight
 from pygments.formatters.html import HtmlFormatter
 from monokai_colors import ManimMonokaiStyle
+import difflib
+import functools
+import hashlib
+import inspect
+import json
+import os
+import pygments
 import re
 
+_CODE_STORE = None
+
+PARAGRAPH_ATTRIBUTES = ("line_spacing", "tab_width", "font_size", "font", "stroke_width", "scale_factor")
+
 class PreCode(Code):
     def ensure_valid_file(self):
         """Function to validate file."""
@@ -53,6 +64,33 @@ class PreCode(Code):
             ) as file:
                 file.write(self.html_string)
 
+    def _paragraph_key(self, kind, content):
+        options = {name: getattr(self, name, None) for name in PARAGRAPH_ATTRIBUTES}
+        payload = json.dumps([kind, content, options], default=str)
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def gen_colored_lines(self):
+        """Colored code lines, with their glyph geometry served from the code store."""
+        key = self._paragraph_key("lines", [self.code_json, self.tab_spaces])
+        store = get_code_store()
+        if store is None:
+            return super().gen_colored_lines()
+        code = store.get_or_create(key, super().gen_colored_lines)
+        code.chars = VGroup(*code.submobjects)
+        return code
+
+    def gen_line_numbers(self):
+        """Line numbers, with their glyph geometry served from the code store."""
+        key = self._paragraph_key(
+            "line_numbers", [self.line_no_from, len(self.code_json), str(self.default_color)]
+        )
+        store = get_code_store()
+        if store is None:
+            return super().gen_line_numbers()
+        line_numbers = store.get_or_create(key, super().gen_line_numbers)
+        line_numbers.chars = VGroup(*line_numbers.submobjects)
+        return line_numbers
+
 
 class ManimCode(PreCode):
     def __init__(self,
@@ -79,6 +117,281 @@ class ManimCode(PreCode):
     
 
 
+class TokenCode(ManimCode):
+    """ManimCode colored straight from the lexer tokens and the
+    ManimMonokaiStyle colors. No HTML is generated, written or parsed,
+    so generate_html_file is ignored, and glyphs are built in memory
+    without the code store, so nothing is written to disk.
+    """
+
+    def gen_colored_lines(self):
+        return Code.gen_colored_lines(self)
+
+    def gen_line_numbers(self):
+        return Code.gen_line_numbers(self)
+
+    def gen_html_string(self):
+        # Code reads its background color from the html string.
+        self.html_string = f'<pre style="background: {ManimMonokaiStyle.background_color}">'
+
+    def gen_code_json(self):
+        self.default_color = get_default_color(ManimMonokaiStyle.background_color)
+        self.code_json, self.tab_spaces = tokens_to_code_json(
+            self.lexer.get_tokens(self.code_string),
+            ManimMonokaiStyle,
+            self.indentation_chars,
+            self.default_color,
+        )
+
+
+class TransformCode(AnimationGroup):
+    """Animation that turns one code listing into another by diffing their tokens.
+
+    Tokens found in both listings keep their glyphs: they stay static when
+    they do not move, and are transformed to their new place otherwise.
+    Removed tokens fade out and inserted tokens fade in. At the end the
+    source listing is replaced by the target in the scene.
+
+    Parameters
+    ---------
+    source : :class:`Code`
+        Listing currently in the scene.
+    target : :class:`Code`
+        Listing to end with, placed where it should appear.
+    """
+
+    def __init__(self, source, target, **kwargs):
+        self.source = source
+        self.target = target
+        self.introduced = []
+        source_tokens = code_token_glyphs(source)
+        target_tokens = code_token_glyphs(target)
+        matcher = difflib.SequenceMatcher(
+            None,
+            [key for key, _ in source_tokens],
+            [key for key, _ in target_tokens],
+            autojunk=False,
+        )
+        animations = []
+        for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+            if tag == "equal":
+                for (_, old), (_, new) in zip(source_tokens[i1:i2], target_tokens[j1:j2]):
+                    if not np.allclose(old.get_center(), new.get_center(), atol=1e-3):
+                        animations.append(Transform(old, new))
+                continue
+            animations.extend(self._fade(old, None) for _, old in source_tokens[i1:i2])
+            animations.extend(self._fade(None, new) for _, new in target_tokens[j1:j2])
+        for name in ("background_mobject", "line_numbers"):
+            old, new = getattr(source, name, None), getattr(target, name, None)
+            if old is not None and new is not None:
+                animations.append(Transform(old, new))
+            elif old is not None or new is not None:
+                animations.append(self._fade(old, new))
+        if not animations:
+            animations.append(Animation(source))
+        # The source is already in the scene, so it is used as the group
+        # instead of a new group that the scene would add and draw again.
+        super().__init__(*animations, group=source, **kwargs)
+
+    def _fade(self, old, new):
+        if old is not None:
+            return old.animate.set_opacity(0)
+        self.introduced.append(new)
+        return FadeIn(new)
+
+    def clean_up_from_scene(self, scene):
+        super().clean_up_from_scene(scene)
+        scene.remove(self.source, *self.introduced)
+        scene.add(self.target)
+
+
+def code_token_glyphs(code, lexer=None):
+    """Function that pairs the visible tokens of a Code mobject with their glyphs.
+
+    Parameters
+    ---------
+    code : :class:`Code`
+        The listing, its ``code_json`` and ``tab_spaces`` locate the glyphs.
+    lexer : :class:`pygments.lexer.Lexer`
+        Defaults to the lexer of a ManimCode, or ManimLexer.
+
+    Returns
+    -------
+    :class:`list`
+        ``((token type, text), VGroup of glyphs)`` per token and line,
+        whitespace excluded.
+    """
+    lexer = lexer or getattr(code, "lexer", None) or ManimLexer()
+    lines = [""]
+    pieces = []
+    for ttype, value in lexer.get_tokens(code.code_string):
+        for index, part in enumerate(value.split("\n")):
+            if index:
+                lines.append("")
+            if part.strip():
+                pieces.append((ttype, part, len(lines) - 1, len(lines[-1])))
+            lines[-1] += part
+
+    result = []
+    for ttype, text, line_no, column in pieces:
+        if line_no >= len(code.code_json):
+            break
+        line_text = "".join(run[0] for run in code.code_json[line_no])
+        start = code.tab_spaces[line_no] + column - (len(lines[line_no]) - len(line_text))
+        glyphs = code.code.chars[line_no].submobjects[start:start + len(text)]
+        if glyphs:
+            result.append(((ttype, text), VGroup(*glyphs)))
+    return result
+
+
+def get_default_color(background_color):
+    """Color of unstyled code: white on dark backgrounds, black otherwise."""
+    return "#ffffff" if sum(color_to_rgb(background_color)) < 1.5 else "#000000"
+
+
+def tokens_to_lines(tokens, style, default_color="#ffffff"):
+    """Function that splits lexer tokens into lines of colored runs.
+
+    Parameters
+    ---------
+    tokens : iterable of (token type, text)
+        Output of ``lexer.get_tokens``.
+    style : :class:`pygments.style.StyleMeta`
+        Style class giving the color of each token type.
+    default_color : :class:`str`
+        Color of tokens the style does not color.
+
+    Returns
+    -------
+    :class:`list`
+        One list of ``[text, color]`` per line, one run per token.
+    """
+    colors = {}
+    lines = [[]]
+    for ttype, value in tokens:
+        color = colors.get(ttype)
+        if color is None:
+            color = style.style_for_token(ttype)["color"]
+            color = colors[ttype] = f"#{color}" if color else default_color
+        for index, part in enumerate(value.split("\n")):
+            if index:
+                lines.append([])
+            if part:
+                lines[-1].append([part, color])
+    if not lines[-1]:
+        lines.pop()
+    return lines
+
+
+def split_indentation(runs, indentation_chars="    "):
+    """Removes the leading tabs and indentation_chars of a line of runs and returns their count."""
+    text = "".join(run[0] for run in runs)
+    count = 0
+    stripped = 0
+    while True:
+        if text.startswith("\t", stripped):
+            stripped += 1
+        elif text.startswith(indentation_chars, stripped):
+            stripped += len(indentation_chars)
+        else:
+            break
+        count += 1
+    result = []
+    for run_text, color in runs:
+        if stripped >= len(run_text):
+            stripped -= len(run_text)
+            continue
+        result.append([run_text[stripped:], color])
+        stripped = 0
+    return count, result
+
+
+def tokens_to_code_json(tokens, style, indentation_chars="    ", default_color="#ffffff"):
+    """Function that builds Code's ``code_json`` and ``tab_spaces`` from lexer tokens.
+
+    Leading indentation becomes a tab count, as Code does when it parses
+    its HTML, and adjacent runs of the same color are merged.
+
+    Returns
+    -------
+    :class:`tuple`
+        ``(code_json, tab_spaces)``
+    """
+    code_json = []
+    tab_spaces = []
+    for runs in tokens_to_lines(tokens, style, default_color):
+        count, runs = split_indentation(runs, indentation_chars)
+        merged = []
+        for text, color in runs:
+            if merged and merged[-1][1] == color:
+                merged[-1][0] += text
+            else:
+                merged.append([text, color])
+        code_json.append(merged)
+        tab_spaces.append(count)
+    return code_json, tab_spaces
+
+
+def get_code_store(max_bytes=256 * 1024 ** 2):
+    """Store of highlighted HTML and code glyph geometry, under the media directory.
+
+    Returns None, and code is built without caching, when the repo's
+    ``common`` package is not importable (e.g. a notebook run from this
+    folder without the repo root on the path).
+    """
+    global _CODE_STORE
+    if _CODE_STORE is None:
+        try:
+            from common.utils.geometry_cache import GeometryStore
+        except ImportError:
+            return None
+        _CODE_STORE = GeometryStore(os.path.join(config.media_dir, "code_cache"), max_bytes)
+    return _CODE_STORE
+
+
+@functools.lru_cache(maxsize=None)
+def _class_digest(cls):
+    try:
+        source = inspect.getsource(inspect.getmodule(cls))
+    except (OSError, TypeError):
+        source = cls.__qualname__
+    return hashlib.sha256(source.encode()).hexdigest()
+
+
+def highlight_key(code, lexer, style, insert_line_no, divstyles, line_no_from):
+    """Hash of everything the highlighted HTML of a code string depends on.
+
+    Parameters
+    ---------
+    code : :class:`str`
+        Code string.
+    lexer : :class:`pygments.lexer.Lexer`
+        The lexer, identified by the pygments version, the source of its
+        module, its options and its vocabulary if it has one.
+    style : :class:`pygments.style.StyleMeta`
+        The style class, identified by its name, source and colors.
+    """
+    vocabulary = getattr(lexer, "vocabulary", None)
+    if vocabulary is not None:
+        vocabulary = [sorted((name, str(token)) for name, token in table.items())
+                      for table in (vocabulary.names, vocabulary.bare_names, vocabulary.methods)]
+    payload = json.dumps([
+        code,
+        pygments.__version__,
+        f"{type(lexer).__module__}.{type(lexer).__qualname__}",
+        _class_digest(type(lexer)),
+        lexer.options,
+        vocabulary,
+        style.__qualname__,
+        _class_digest(style),
+        sorted((str(token), value) for token, value in style.styles.items()),
+        insert_line_no,
+        divstyles,
+        line_no_from,
+    ], default=str)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
 def insert_line_numbers_in_html(html, line_no_from):
     """Function that inserts line numbers in the highlighted HTML code.
 
@@ -140,7 +453,19 @@ def hilite_me_manim(
         Path of code file.
     line_no_from : :class:`int`
         Defines the first line's number in the line count.
+
+    Results are cached in the code store, keyed by :func:`highlight_key`.
     """
+    if language is None and not file_path:
+        raise ValueError(
+            "The code language has to be specified when rendering a code string",
+        )
+    store = get_code_store()
+    key = highlight_key(code, lexer, ManimMonokaiStyle, insert_line_no, divstyles, line_no_from)
+    cached = store.load_text(key, "html") if store is not None else None
+    if cached is not None:
+        return cached
+
     style = style or "colorful"
     defstyles = "overflow:auto;width:auto;"
 
@@ -164,4 +489,6 @@ def hilite_me_manim(
     if insert_line_no:
         html = insert_line_numbers_in_html(html, line_no_from)
     html = "<!-- HTML generated by Code() -->" + html
+    if store is not None:
+        store.save_text(key, html, "html")
     return html
\ No newline at end of file
@@ -461,4 +461,237 @@ class ManimLexer(RegexLexer):
 
     def analyse_text(text):
         return shebang_matches(text, r'pythonw?(3(\.\d)?)?') or \
-            'import ' in text[:1000]
\ No newline at end of file
+            'import ' in text[:1000]
+
+# Fast path
+# ---------
+# ManimLexer matches every manim name through alternations compiled into
+# its states. FastManimLexer matches any identifier once and classifies it
+# with dict lookups in a ManimVocabulary, which can grow at runtime.
+
+PYTHON_KEYWORDS = {
+    'assert', 'async', 'await', 'break', 'continue', 'del', 'elif',
+    'else', 'except', 'finally', 'for', 'global', 'if', 'lambda',
+    'pass', 'raise', 'nonlocal', 'return', 'try', 'while', 'yield',
+    'as', 'with',
+}
+
+OPERATOR_WORDS = {'in', 'is', 'and', 'or', 'not'}
+
+MAGIC_VARIABLES = {
+    '__annotations__', '__bases__', '__class__', '__closure__',
+    '__code__', '__defaults__', '__dict__', '__doc__', '__file__',
+    '__func__', '__globals__', '__kwdefaults__', '__module__',
+    '__mro__', '__name__', '__objclass__', '__qualname__',
+    '__self__', '__slots__', '__weakref__',
+}
+
+MANIM_CONSTANTS = [
+    "RIGHT", "LEFT", "UP", "DOWN", "OUT", "IN", "ORIGIN", "UR", "UL", "DR", "DL",
+    "RED", "BLUE", "GREEN", "TEAL", "ORANGE", "PINK", "PURPLE", "YELLOW", "WHITE",
+    "DEGREES", "PI", "TAU", "POINT", "TAN_ANGLE", "ANGLE", "LENGTH_PALLETE",
+]
+
+
+class ManimVocabulary:
+    """
+    Token types of known names, in three tables looked up in order:
+    names (python keywords, mobjects, constants, vectors and colors),
+    bare names (builtins and keyword arguments, only when not written
+    after a dot) and methods. Earlier tables win, as earlier states do
+    in ManimLexer.
+    """
+
+    def __init__(self):
+        self.names = dict.fromkeys(PYTHON_KEYWORDS, Keyword)
+        self.names.update(dict.fromkeys(OPERATOR_WORDS, Operator.Word))
+        self.names.update(dict.fromkeys(('True', 'False', 'None'), Keyword.Constant))
+        self.bare_names = {}
+        self.methods = {}
+
+    def _add(self, table, names, token_type, overwrite):
+        for name in names:
+            if overwrite or name not in table:
+                table[name] = token_type
+        return self
+
+    def add_mobjects(self, names, overwrite=True):
+        return self._add(self.names, names, Keyword, overwrite)
+
+    def add_functions(self, names, overwrite=True):
+        return self._add(self.names, names, Keyword.Constant, overwrite)
+
+    def add_constants(self, names, overwrite=True):
+        return self._add(self.names, names, Number.Integer, overwrite)
+
+    def add_arguments(self, names, overwrite=True):
+        return self._add(self.bare_names, names, Name.Builtin.Pseudo, overwrite)
+
+    def add_methods(self, names, overwrite=True):
+        return self._add(self.methods, names, Name.Function.Magic, overwrite)
+
+    def add_builtins(self):
+        import builtins
+        for name in dir(builtins):
+            value = getattr(builtins, name)
+            if isinstance(value, type) and issubclass(value, BaseException):
+                self.bare_names.setdefault(name, Name.Exception)
+            elif not name.startswith('_') or name == '__import__':
+                self.bare_names.setdefault(name, Name.Builtin)
+        return self
+
+    def classify(self, name, after_dot=False):
+        token_type = self.names.get(name)
+        if token_type is None and not after_dot:
+            token_type = self.bare_names.get(name)
+        if token_type is None:
+            token_type = self.methods.get(name)
+        if token_type is None and name.startswith('__') and name.endswith('__'):
+            token_type = Name.Variable.Magic if name in MAGIC_VARIABLES else Name.Function.Magic
+        return token_type or Name
+
+    def harvest_manim(self, module=None):
+        """
+        Adds the public names of manim, without overriding names that are
+        already known: classes as mobjects, rate functions as functions,
+        upper-case names as constants, other callables as mobjects (as
+        rotate_vector is), and the public methods of Mobject, VMobject
+        and Scene as methods.
+        """
+        if module is None:
+            import manim as module
+        names = getattr(module, '__all__', None) or dir(module)
+        for name in names:
+            if name.startswith('_'):
+                continue
+            value = getattr(module, name, None)
+            if isinstance(value, type):
+                self.add_mobjects([name], overwrite=False)
+            elif name.isupper():
+                self.add_constants([name], overwrite=False)
+            elif callable(value):
+                if getattr(value, '__module__', '').endswith('rate_functions'):
+                    self.add_functions([name], overwrite=False)
+                else:
+                    self.add_mobjects([name], overwrite=False)
+        for cls in (module.Mobject, module.VMobject, module.Scene):
+            self.add_methods([name for name in dir(cls)
+                              if not name.startswith('_') and callable(getattr(cls, name, None))],
+                             overwrite=False)
+        return self
+
+
+def get_default_vocabulary():
+    vocabulary = ManimVocabulary()
+    vocabulary.add_mobjects(MANIM_MOBS)
+    vocabulary.add_functions(["animate", "points", *FUNCS])
+    vocabulary.add_constants(MANIM_CONSTANTS)
+    vocabulary.add_arguments(["self", "Ellipsis", "NotImplemented", "cls",
+                              *MANIM_ARGS.split("|")])
+    vocabulary.add_builtins()
+    vocabulary.add_methods(MANIM_METHODS)
+    return vocabulary
+
+
+MANIM_VOCABULARY = get_default_vocabulary()
+
+
+def _name_callback(lexer, match):
+    start = match.start()
+    after_dot = start > 0 and match.string[start - 1] == '.'
+    yield start, lexer.vocabulary.classify(match.group(), after_dot), match.group()
+
+
+def _function_name_callback(lexer, match):
+    name = match.group()
+    token_type = lexer.vocabulary.methods.get(name, Name.Function)
+    if name.startswith('__') and name.endswith('__'):
+        token_type = Name.Function.Magic
+    yield match.start(), token_type, name
+
+
+class FastManimLexer(ManimLexer):
+    """
+    ManimLexer with every identifier matched by one generic rule and
+    classified through a ManimVocabulary. Extend MANIM_VOCABULARY (or
+    pass vocabulary=...) to highlight more names, for example with
+    MANIM_VOCABULARY.harvest_manim().
+
+    Unlike ManimLexer, constants only match whole names (UPDATE is not
+    split into UP and DATE), and names inside f-string expressions are
+    classified as everywhere else.
+    """
+
+    name = 'Manim'
+    aliases = ['manim']
+
+    uni_name = ManimLexer.uni_name
+
+    tokens = {
+        # Identifiers come first: with one rule per manim name gone, the
+        # cost of a token is the number of rules tried before it matches.
+        'root': [
+            (r'\n', Text),
+            (r'^(\s*)([rRuUbB]{,2})("""(?:.|\n)*?"""|\'\'\'(?:.|\n)*?\'\'\')',
+             bygroups(Text, String.Affix, String.Doc)),
+            (r'(?!(?:def|class|from|import)\b)' + uni_name + r'(?![\w\'"])', _name_callback),
+            (r'[^\S\n]+', Text),
+            (r'\A#!.+$', Comment.Hashbang),
+            (r'#.*$', Comment.Single),
+            (r'\\\n?', Text),
+            (r'(def)((?:\s|\\\s)+)', bygroups(Keyword, Text), 'funcname'),
+            (r'(class)((?:\s|\\\s)+)', bygroups(Keyword, Text), 'classname'),
+            (r'(from)((?:\s|\\\s)+)', bygroups(Keyword.Namespace, Text),
+             'fromimport'),
+            (r'(import)((?:\s|\\\s)+)', bygroups(Keyword.Namespace, Text),
+             'import'),
+            include('expr'),
+        ],
+        'expr': [
+            (uni_name + r'(?![\w\'"])', _name_callback),
+            (r'[^\S\n]+', Text),
+            include('numbers'),
+            (r'!=|==|<<|>>|:=|[-~+/*%=<>&^|.]', Operator),
+            (r'[]{}:(),;[]', Punctuation),
+            *ManimLexer.tokens['expr'][:16],  # string literals
+            include('name'),
+        ],
+        'numbers': ManimLexer.tokens['numbers'][:6],
+        'name': [
+            (r'@' + uni_name, Name.Decorator),
+            (r'@', Operator),
+            (uni_name, _name_callback),
+        ],
+        'funcname': [
+            (uni_name, _function_name_callback, '#pop'),
+            default('#pop'),
+        ],
+    }
+
+    def __init__(self, vocabulary=None, **options):
+        super().__init__(**options)
+        self.vocabulary = vocabulary or MANIM_VOCABULARY
+
+
+if __name__ == "__main__":
+    # Benchmark against ManimLexer on the python files of the repo
+    import time
+    from pathlib import Path
+
+    root = Path(__file__).resolve().parents[2]
+    sources = [path.read_text(encoding="utf-8") for path in sorted(root.rglob("*.py"))]
+    code = "\n".join(sources)
+    print(f"{len(sources)} files, {code.count(chr(10))} lines")
+
+    for lexer in (ManimLexer(), FastManimLexer()):
+        list(lexer.get_tokens("Square()"))  # compile the states
+        start = time.perf_counter()
+        tokens = list(lexer.get_tokens(code))
+        print(f"{type(lexer).__name__}: {len(tokens)} tokens in {time.perf_counter() - start:.3f}s")
+
+    import difflib
+    reference = list(ManimLexer().get_tokens(code))
+    fast = list(FastManimLexer().get_tokens(code))
+    matcher = difflib.SequenceMatcher(None, reference, fast, autojunk=False)
+    same = sum(block.size for block in matcher.get_matching_blocks())
+    print(f"{same}/{len(reference)} tokens identical")
@@ -1,4 +1,5 @@
 from manim import *
+from common.utils.color_utils import color_by_gradient
 
 config.assets_dir = "./assets"
 SCENE_NAME = "TestDashedVMobject"
@@ -19,7 +20,7 @@ class Test2DPlot(Scene):
 class TestDashedVMobject(Scene):
     def setup(self):
         dash_line = DashedVMobject(Line().rotate(PI/2), num_dashes=40, dashed_ratio=1)
-        for index, i in enumerate(dash_line.submobjects):
-            i.set_color(color=interpolate_color(RED,YELLOW, index/len(dash_line.submobjects)))
+        alphas = np.arange(len(dash_line.submobjects)) / len(dash_line.submobjects)
+        color_by_gradient(dash_line, [RED, YELLOW], alphas)
         self.add(dash_line)
         print(dash_line.submobjects)
@@ -3,6 +3,7 @@ from common.custom.custom_animation import *
 from common.custom.custom_rate_func import rate_func_from_bezier
 from common.custom.custom_rate_func import parabola
 from common.utils.range_utils import real_range
+from common.utils.svg_cache import cached_svg_mobject
 
 config.assets_dir = "./assets"
 SCENE_NAME = "TestRotating"
@@ -16,7 +17,7 @@ if __name__ == "__main__":
 
 class TestLoadSvg(Scene):
     def setup(self):
-        t = SVGMobject("facebook").set_color(RED)
+        t = cached_svg_mobject("facebook").set_color(RED)
         self.add(t)
 
 
@@ -78,7 +79,7 @@ class AnimationEx4(Scene):
     def construct(self):
         self.add(self.hello)
         handles = [.63, -0.91, .68, -0.89]
-        rate_func = rate_func_from_bezier(handles)
+        rate_func = rate_func_from_bezier(handles, method="exact")
         self.play(
             LaggedStart(
                 *[ShinkToCenter(i, rate_func=rate_func) for i in self.hello]
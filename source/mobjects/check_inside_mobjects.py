@@ -1,6 +1,10 @@
-import random
-
 from manim import *
+from common.utils.containment_utils import points_in_vmobject
+from common.utils.spatial_utils import get_border_index
+from common.custom.custom_mobject import InstancedMobject
+from common.utils.color_utils import mask_rgbs
+from common.utils.curve_utils import curve_points, sample_points
+from common.utils.random_utils import get_scene_rng
 SCENE_NAME = "example"
 
 if __name__ == "__main__":
@@ -21,7 +25,7 @@ class CheckInside(Scene):
             .set_points_smoothly([A,B,C,D,E,F,A])\
 
         point_num = 30
-        border = [ground.point_from_proportion(i/point_num) for i in range(point_num)]
+        border = sample_points(ground, np.arange(point_num) / point_num)
         dot = [Dot(border[i])
                for i in range(len(border))]
         line = [Line(start=border[i],end=border[i+1],
@@ -51,20 +55,6 @@ class CheckInside(Scene):
         self.add(target_dot, nearest_dot, arrow1, arrow2)
 
 class CheckInsideTest(Scene):
-    def get_random_position(self):
-        x = random.uniform(-2,2)
-        y = random.uniform(-2,2)
-        return np.array([x,y,0])
-    def get_nearest_dot_index(self, target_dot):
-        nearest_point = 0
-        length = np.linalg.norm(target_dot.get_center() - self.border[0])
-        for index, i in enumerate(self.border):
-            curr_length = np.linalg.norm(target_dot.get_center() - i)
-            if curr_length < length:
-                nearest_point = index
-                length = curr_length
-        return nearest_point
-
     def construct(self):
         A = np.array([0,0,0])
         B = np.array([1,1,0])
@@ -78,6 +68,7 @@ class CheckInsideTest(Scene):
         point_num = 50
         # self.border = [ground.point_from_proportion(i/point_num) for i in range(point_num)]
         self.border = ground.points
+        self.border_index = get_border_index(ground)
         dot = [Dot(self.border[i])
                for i in range(len(self.border))]
         line = [Line(start=self.border[i],end=self.border[i+1],
@@ -85,22 +76,19 @@ class CheckInsideTest(Scene):
                      color=RED)
                 for i in range(len(self.border)-1)]
         dot_num = 1000
-        dots = [Dot(self.get_random_position()) for i in range(dot_num)]
-        for dot in dots:
-            nearest_point = self.get_nearest_dot_index(dot)
-            first_vec = dot.get_center() - self.border[nearest_point]
-            second_vec = self.border[nearest_point] - self.border[nearest_point-1]
-            cross = cross_product(first_vec, second_vec)
-            if cross[2]>=0:
-                dot.set_color(GREEN)
-            else:
-                dot.set_color(RED)
+        centers = get_scene_rng(self).uniform_in_box(dot_num, (-2, 2), (-2, 2))
+        dots = InstancedMobject(Dot(), centers)
+        nearest_points = self.border_index.nearest(centers)
+        first_vecs = centers - self.border[nearest_points]
+        second_vecs = self.border[nearest_points] - self.border[nearest_points-1]
+        cross = np.cross(first_vecs, second_vecs)
+        dots.set_instance_colors(mask_rgbs(cross[:, 2] >= 0, GREEN, RED))
 
         border_lines = [Line(start=self.border[i], end=self.border[i+1], color=YELLOW, stroke_width=3)
                         for i in range(len(self.border)-1)]
         border_dots = [Dot(self.border[i], color=YELLOW, ).scale(0.5)
                         for i in range(len(self.border))]
-        self.add(ground, *dots)
+        self.add(ground, dots)
         self.add(*border_dots)
 
 
@@ -111,12 +99,8 @@ def dist(u, v):
     return np.sqrt((u[0] - v[0]) ** 2 + (u[1] - v[1]) ** 2)
 
 def generate_list_of_points(shape):
-    P = [shape.get_start()]
     T = np.linspace(0, 1, 20)
-    for func in shape.get_curve_functions():
-        for t in T:
-            P.append(func(t))
-    return np.array(P)
+    return np.vstack([shape.get_start(), curve_points(shape, T)])
 
 def closest_point(list, target):
     best = 0
@@ -136,10 +120,6 @@ def is_in_shape(point, P_list):
     return cross_product_res[2] > 0
 
 class example(MovingCameraScene):
-    def get_random_position(self):
-        x = random.uniform(-2,2)
-        y = random.uniform(-2,2)
-        return np.array([x,y,0])
     def construct(self):
         A1 = np.array([0, 0, 0])
         B1 = np.array([1, 1, 0])
@@ -150,16 +130,12 @@ class example(MovingCameraScene):
         C = VMobject(fill_color=YELLOW, fill_opacity=0.5) \
             .set_points_smoothly([A1, B1, C1, D1, E1, F1, A1])
         dot_num = 100000
-        dots = [Dot(self.get_random_position()).scale(0.1) for i in range(dot_num)]
-        C_points = [C.point_from_proportion(t) for t in np.linspace(0, 1, 100)]
-        # C_points = generate_list_of_points(C)
+        positions = get_scene_rng(self).uniform_in_box(dot_num, (-2, 2), (-2, 2))
+        dots = InstancedMobject(Dot().scale(0.1), positions)
         D = Dot(radius=0.05).move_to([0.5, 0, 0])
-        for dot in dots:
-            if is_in_shape(dot.get_center(), C_points):
-                dot.set_color(GREEN)
-            else:
-                dot.set_color(RED)
-        self.add(C, *dots)
+        inside = points_in_vmobject(positions, C)
+        dots.set_instance_colors(mask_rgbs(inside, GREEN, RED))
+        self.add(C, dots)
         # label = always_redraw(
         #     lambda: Text(f"{is_in_shape(D.get_center(), C_points)}", font_size=20).next_to(D))
         #
@@ -1,7 +1,9 @@
-import random
-
 from manim import *
 import os
+from common.custom.custom_mobject import MonteCarloArea, GlyphNumber
+from common.utils.tex_cache import cached_math_tex
+from common.utils.svg_cache import cached_svg_mobject
+from common.utils.random_utils import get_scene_rng
 
 SCENE_NAME = "Scene7"
 
@@ -28,36 +30,6 @@ class MyScene(Scene):
         self.wait()
 
 
-def cross_product(u, v):
-    return np.array([u[1] * v[2] - u[2] * v[1], u[2] * v[0] - u[0] * v[2], u[0] * v[1] - u[1] * v[0]])
-
-
-def dist(u, v):
-    return np.sqrt((u[0] - v[0]) ** 2 + (u[1] - v[1]) ** 2)
-
-
-def closest_point(list, target):
-    best = 0
-    best_dist = dist(list[best], target)
-    for i in range(len(list)):
-        if dist(list[i], target) < best_dist:
-            best = i
-            best_dist = dist(list[best], target)
-    return best
-
-
-def is_in_shape(point, P_list, greater_than_one):
-    n = closest_point(P_list, point)
-    l = len(P_list)
-    tangent_vector = P_list[(n + 1) % l] - P_list[(n - 1) % l]
-    to_target_vector = point - P_list[n]
-    cross_product_res = cross_product(tangent_vector, to_target_vector)
-    if greater_than_one:
-        return cross_product_res[2] >= 0
-    else:
-        return cross_product_res[2] <= 0
-
-
 myTemplate = TexTemplate()
 myTemplate.add_to_preamble(r"\usepackage{vntex}")
 rel_obj = 50000
@@ -66,35 +38,21 @@ test_obj = 1000
 test_time = 3
 
 class Scene7(MyScene):
-    def get_random_position(self):
-        x = random.uniform(-2.5, 2.5)
-        y = random.uniform(-2.5, 2.5)
-        return np.array([x, y, 0])
-
     def construct(self):
         square = Square(side_length=5, stroke_color=ORANGE)
-        shape = SVGMobject("bitcoin3",
-                           stroke_color=ORANGE,
-                           stroke_width=2).scale(2.2)
+        shape = cached_svg_mobject("bitcoin3",
+                                   stroke_color=ORANGE,
+                                   stroke_width=2).scale(2.2)
         brace = Brace(square, UP)
         side = brace.get_tex("a=", "5(m)")
 
         self.my_play(DrawBorderThenFill(shape))
         self.my_play(Write(square))
         self.my_play(FadeIn(brace, shift=DOWN), FadeIn(side, shift=DOWN))
-        num_point = 200
-        sub_point = 30
-        list_point1 = [shape[0].point_from_proportion(i / num_point)
-                      for i in range(num_point)]
-        list_point2 = [shape[1].point_from_proportion(i / sub_point)
-                      for i in range(sub_point)]
-        list_point3 = [shape[2].point_from_proportion(i / sub_point)
-                      for i in range(sub_point)]
-
         myTemplate = TexTemplate()
         myTemplate.add_to_preamble(r"\usepackage{vntex}")
 
-        formula = MathTex(
+        formula = cached_math_tex(
             r"S_",  # 0
             r"{ab}",  # 1
             r"\approx",  # 2
@@ -125,56 +83,45 @@ class Scene7(MyScene):
             Write(formula3[2:])
         ], lag_ratio=0.3))
 
-        self.num_dot = 0
-        self.num_green = 0
-
         tracker = ValueTracker(0)
-
-        def draw_tex():
-            dot_green = Text(str(self.num_green),
-                             color=GREEN,
-                             font_size=30,
-                             font="Arial") \
-                .scale(0.8) \
-                .move_to(formula[3])
-            dot_total = Text(str(self.num_dot),
-                             color=RED,
-                             font_size=30,
-                             font="Arial") \
-                .scale(0.8) \
-                .move_to(formula[5])
-            result = "0.0000"
-            if self.num_dot != 0:
-                result = "{:.5f}".format(25 * self.num_green / self.num_dot)
-            s = Text(result,
-                     color=YELLOW,
-                     font_size=30,
-                     font="Arial") \
-                .scale(0.7) \
-                .next_to(formula2, RIGHT, aligned_edge=LEFT)
-            return VGroup(dot_green, dot_total, s)
-
-        group = always_redraw(draw_tex)
-
-        self.add(tracker, group)
-
-        def update(obj):
-            value = tracker.get_value()
-            if int(value) > self.num_dot:
-                more_point = int(value) - self.num_dot
-                self.num_dot = int(value)
-                for i in range(more_point):
-                    dot = Square(side_length=0.01, stroke_width=2).move_to(self.get_random_position())
-                    if is_in_shape(dot.get_center(), list_point1, True) \
-                            and is_in_shape(dot.get_center(), list_point2, True) \
-                            and is_in_shape(dot.get_center(), list_point3, True):
-                        dot.set_color(ORANGE)
-                        self.num_green += 1
-                    else:
-                        dot.set_color(WHITE)
-                    self.add(dot)
-
-        shape.add_updater(update)
+        sampler = MonteCarloArea(shape,
+                                 x_range=(-2.5, 2.5),
+                                 y_range=(-2.5, 2.5),
+                                 inside_color=ORANGE,
+                                 outside_color=WHITE,
+                                 seed=get_scene_rng(self))
+
+        dot_green = GlyphNumber(0,
+                                color=GREEN,
+                                font_size=30,
+                                font="Arial") \
+            .scale(0.8) \
+            .move_to(formula[3])
+        dot_total = GlyphNumber(0,
+                                color=RED,
+                                font_size=30,
+                                font="Arial") \
+            .scale(0.8) \
+            .move_to(formula[5])
+        s = GlyphNumber(0,
+                        number_format="{:.5f}",
+                        color=YELLOW,
+                        font_size=30,
+                        font="Arial",
+                        aligned_edge=LEFT) \
+            .scale(0.7) \
+            .next_to(formula2, RIGHT, aligned_edge=LEFT)
+        group = VGroup(dot_green, dot_total, s)
+
+        def update_labels(obj):
+            dot_green.set_value(sampler.num_inside)
+            dot_total.set_value(sampler.num_samples)
+            s.set_value(sampler.get_estimate())
+
+        group.add_updater(update_labels)
+
+        sampler.add_tracker_updater(tracker)
+        self.add(tracker, sampler, group)
 
         self.my_play(tracker.animate.increment_value(rel_obj),
                   run_time=rel_time,
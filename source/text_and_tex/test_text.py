@@ -1,5 +1,6 @@
 from manim import *
 import os
+from common.utils.mobject_utils import get_indexes
 
 SCENE_NAME = "TestTexIndex"
 
@@ -90,11 +91,7 @@ class TestTextIndex(Scene):
         text = Text("Hello world!")
         print(text.submobjects)
         def get_subindexes_from_text(text):
-            return VGroup(*[
-                Text(str(i), font_size=15, font="Times")
-                .next_to(t, DOWN, buff=0.05)
-                for i, t in enumerate(text)
-            ])
+            return get_indexes(text, font_size=15, color_tex=False, colors=[WHITE])
         self.add(text, get_subindexes_from_text(text))
 
 class TestTexIndex(Scene):
@@ -103,16 +100,8 @@ class TestTexIndex(Scene):
                        "s", "-", "b", ")(", "s", "-", "c", ")}","=4.01").scale(0.8)
 
         def get_sub_indexes(tex, color_tex=True):
-            from itertools import cycle
-            ni = VGroup()
-            colors = cycle([RED, TEAL, GREEN, BLUE, PURPLE])
-            for i in range(len(tex)):
-                c = next(colors)
-                n = Text(f"{i}", color=c).scale(0.3)
-                n.next_to(tex[i], DOWN, buff=0.05)
-                ni.add(n)
-                if color_tex: tex[i].set_color(c)
-            return ni
+            return get_indexes(tex, font_size=DEFAULT_FONT_SIZE * 0.3,
+                               color_tex=color_tex, font="")
         self.add(source_tex, get_sub_indexes(source_tex))
 
 class TestTex(Scene):